@@ -3,10 +3,36 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.const import Platform
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 import logging
-from .const import DOMAIN, UPDATE_INTERVAL
+from datetime import timedelta
+from .const import (
+    DOMAIN,
+    CONF_UPDATE_INTERVAL,
+    CONF_SAMPLE_INTERVAL,
+    DEFAULT_UPDATE_INTERVAL,
+    DEFAULT_SAMPLE_INTERVAL,
+    MESH_POLL_INTERVAL,
+    MESH_POLL_CONCURRENCY,
+    MESH_NODE_RETENTION,
+    RCI_CACHE_SIZE,
+    RCI_MIN_INTERVAL,
+    RCI_REQUEST_SPACING,
+    RCI_RESULTS_SIZE,
+    HISTORY_SIZE,
+    HISTORY_MAX_INTERFACES,
+)
 from .api import KeeneticAPI
+from .traffic_accumulator import TrafficAccumulator
+from .topology_cache import TopologyCache
+from .mesh_topology import MeshTopology
+from .transitions import TransitionDetector
+from .mesh_poller import MeshNodePoller
+from .burst_sampler import BurstSampler
+from .rci_cache import RciCache
+from .services import async_setup_services, async_unload_services
+from .window_sampler import WindowSampler
+from .ring_buffer import MetricRingBuffer
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -14,26 +40,80 @@ PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.SWITCH]
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Keenetic from a config entry."""
+    api = KeeneticAPI(
+        host=entry.data["host"],
+        username=entry.data["username"],
+        password=entry.data["password"],
+        port=entry.data["port"],
+    )
+
     try:
-        api = KeeneticAPI(
-            host=entry.data["host"],
-            username=entry.data["username"],
-            password=entry.data["password"],
-            port=entry.data["port"],
-        )
+        traffic = TrafficAccumulator(hass, entry.entry_id)
+        await traffic.async_load()
 
-        if not await api.authenticate():
+        topology = TopologyCache(hass, entry.entry_id)
+        cached_data = await topology.async_load()
+
+        if cached_data is None and not await api.authenticate():
             _LOGGER.error("Failed to authenticate with Keenetic router")
             raise ConfigEntryNotReady("Failed to authenticate")
 
+        mesh_topology = MeshTopology(MESH_NODE_RETENTION)
+        # Link and up states are not cached, the first poll is the baseline
+        # of transitions
+        transitions = TransitionDetector()
+        if cached_data is not None:
+            mesh_topology.seed(cached_data.get("mesh", {}))
+
+        mesh_poller = MeshNodePoller(
+            hass,
+            entry.data["username"],
+            entry.data["password"],
+            entry.data["port"],
+            MESH_POLL_INTERVAL,
+            MESH_POLL_CONCURRENCY,
+            lambda: api.has_consumers("mesh_resources"),
+        )
+
+        history = MetricRingBuffer(HISTORY_SIZE, HISTORY_MAX_INTERFACES)
+
+        update_interval = entry.options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
+        sample_interval = entry.options.get(CONF_SAMPLE_INTERVAL, DEFAULT_SAMPLE_INTERVAL)
+        sampler = None
+        if 0 < sample_interval < update_interval:
+            sampler = WindowSampler(hass, api, sample_interval, update_interval)
+
         async def async_update_data():
             """Fetch data from API."""
             try:
                 data = await api.get_data()
-                _LOGGER.debug("Got data from API: %s", data)
                 if not data or "interface" not in data:
-                    _LOGGER.error("Invalid data received from API")
-                    return None
+                    raise UpdateFailed("No data received from router")
+                data["traffic"] = traffic.update(data["interface"])
+                fresh = {
+                    name for name, status in data["datasets"].items() if status["stale"] is False
+                }
+                mesh_changes = []
+                if "mesh" in fresh:
+                    mesh_changes = mesh_topology.update(data["mesh"])
+                mesh_status = data["datasets"].get("mesh")
+                if mesh_status is None or mesh_status["expired"]:
+                    # Nothing confirms the nodes are still connected
+                    data["mesh"] = mesh_topology.unconfirmed_nodes
+                else:
+                    data["mesh"] = mesh_topology.nodes
+                for event_type, event_data in transitions.update(
+                    data["interface"], mesh_changes, fresh
+                ):
+                    hass.bus.async_fire(event_type, {"entry_id": entry.entry_id, **event_data})
+                mesh_poller.track(data["mesh"])
+                data["mesh_resources"] = mesh_poller.results
+                topology.update(data, api.skipped_datasets)
+                history.add(data["interface"], data)
+                data["history"] = history.summary()
+                if sampler is not None:
+                    data["aggregates"] = sampler.flush()
+                    sampler.track(data["interface"])
                 return data
             except Exception as ex:
                 _LOGGER.error("Error getting data: %s", str(ex))
@@ -44,29 +124,64 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             _LOGGER,
             name=DOMAIN,
             update_method=async_update_data,
-            update_interval=UPDATE_INTERVAL,
+            update_interval=timedelta(seconds=update_interval),
         )
 
-        await coordinator.async_config_entry_first_refresh()
-        
-        if not coordinator.data:
-            raise ConfigEntryNotReady("No data received from router")
-            
-        _LOGGER.debug("Initial coordinator data: %s", coordinator.data)
+        if cached_data is not None:
+            # Create entities from the last known topology, poll in background.
+            # The topology holds no values, entities stay unavailable until
+            # the first poll succeeds.
+            cached_data["traffic"] = traffic.totals(cached_data["interface"])
+            coordinator.data = cached_data
+            coordinator.last_update_success = False
+        else:
+            await coordinator.async_config_entry_first_refresh()
+
+            if not coordinator.data:
+                raise ConfigEntryNotReady("No data received from router")
 
         hass.data.setdefault(DOMAIN, {})
         hass.data[DOMAIN][entry.entry_id] = {
             "coordinator": coordinator,
             "api": api,
+            "traffic": traffic,
+            "mesh_poller": mesh_poller,
+            "burst_sampler": BurstSampler(hass, api, entry.entry_id),
+            "rci_cache": RciCache(
+                api.async_show,
+                RCI_CACHE_SIZE,
+                RCI_MIN_INTERVAL,
+                RCI_REQUEST_SPACING,
+                RCI_RESULTS_SIZE,
+            ),
         }
+        async_setup_services(hass)
         
         _LOGGER.debug("Setting up platforms: %s", PLATFORMS)
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        # Entities registered their datasets while being added
+        api.start_consumer_tracking()
+        entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
+        if coordinator.data:
+            mesh_poller.track(coordinator.data.get("mesh", {}))
+        entry.async_on_unload(mesh_poller.start())
+
+        if sampler is not None:
+            if coordinator.data:
+                sampler.track(coordinator.data["interface"])
+            entry.async_on_unload(sampler.start())
+
+        if cached_data is not None:
+            entry.async_create_background_task(
+                hass, coordinator.async_refresh(), f"{DOMAIN}_first_refresh"
+            )
         
         return True
 
     except Exception as ex:
         _LOGGER.error("Failed to setup Keenetic integration: %s", str(ex))
+        await api.async_close()
         raise ConfigEntryNotReady from ex
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -74,6 +189,15 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        await entry_data["traffic"].async_save()
+        await entry_data["api"].async_close()
+        await entry_data["mesh_poller"].async_close()
+        entry_data["burst_sampler"].stop()
+        async_unload_services(hass)
+
+    return unload_ok
 
-    return unload_ok
\ No newline at end of file
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload a config entry after its options changed."""
+    await hass.config_entries.async_reload(entry.entry_id)
\ No newline at end of file
@@ -1,22 +1,53 @@
 ﻿"""API client for Keenetic routers."""
+import asyncio
+from collections import Counter
 import base64
 import json
 import logging
+import time
 import aiohttp
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Optional
 
 from .const import (
     API_SYSTEM,
     API_VERSION,
     API_INTERFACE,
     API_MESH,
-    MANUFACTURER
+    API_HOSTS,
+    API_ASSOCIATIONS,
+    API_PING_CHECK,
+    API_PROCESSES,
+    DOMAIN,
+    MANUFACTURER,
+    REQUEST_TIMEOUT,
+    PROBE_TIMEOUT,
+    CIRCUIT_BREAKER_THRESHOLD,
+    POLL_DEADLINE,
+    DATASET_MAX_AGE,
+    TOP_TALKERS_COUNT,
+    HOST_TTL,
+    WEAK_RSSI_THRESHOLD,
+    WRITE_DELAY,
+    TOP_PROCESSES_COUNT,
+    PROCESS_POLL_INTERVAL,
+    PROCESS_CPU_THRESHOLD,
+    DEBUG_CAPTURE_RESPONSES,
+    DEBUG_CAPTURE_SNAPSHOTS,
+    ALWAYS_FETCHED_DATASETS,
 )
+from .circuit_breaker import CircuitBreaker
+from .dataset_cache import DatasetCache
+from .debug_capture import DebugCapture
 from .ethernet_processor import EthernetProcessor
 from .wifi_processor import WiFiProcessor
 from .mesh_processor import MeshProcessor
-from .mobile_processor import MobileProcessor
-from .usb_modem_processor import UsbModemProcessor
+from .ping_check_processor import PingCheckProcessor
+from .tunnel_processor import TunnelProcessor
+from .process_processor import ProcessProcessor
+from .write_queue import WriteQueue
+from .schedule_sync import ScheduleSync
+from .modem_processor import ModemProcessor
+from .host_processor import HostProcessor
 
 _LOGGER = logging.getLogger(__name__)
 _TURKISH_ENCODINGS = ("utf-8", "iso-8859-9", "windows-1254", "latin-1")
@@ -61,293 +92,586 @@ async def _safe_json_from_response(resp: aiohttp.ClientResponse):
         )
 
 
+class KeeneticConnectionError(Exception):
+    """Error to indicate the router could not be reached."""
+
+
+class KeeneticAuthError(Exception):
+    """Error to indicate the router rejected the credentials."""
+
+
 class KeeneticAPI:
     """Keenetic API client."""
 
-    def __init__(self, host: str, username: str, password: str, port: int = 81) -> None:
-        """Initialize the API client."""
+    def __init__(
+        self,
+        host: str,
+        username: str,
+        password: str,
+        port: int = 81,
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> None:
+        """Initialize the API client.
+
+        A given session is shared with its owner and never closed here,
+        otherwise the client creates and closes its own.
+        """
         self._host = host
         self._username = username
         self._password = password
         self._port = port
-        self._session = None
+        self._session = session
+        self._own_session = session is None
         self._auth_token = None
         self._base_url = f"http://{self._host}:{self._port}"
+        self._breaker = CircuitBreaker(host, CIRCUIT_BREAKER_THRESHOLD)
+        self._datasets = DatasetCache(DATASET_MAX_AGE)
+        self._host_processor = HostProcessor(TOP_TALKERS_COUNT, HOST_TTL)
+        self._ping_check_processor = PingCheckProcessor()
+        self._process_processor = ProcessProcessor(
+            TOP_PROCESSES_COUNT, PROCESS_POLL_INTERVAL, PROCESS_CPU_THRESHOLD
+        )
+        self._interface_status: Optional[asyncio.Task] = None
+        self._write_queue = WriteQueue(self._request, WRITE_DELAY)
+        self._consumers: Counter[str] = Counter()
+        self._track_consumers = False
+        self._skipped: set[str] = set()
+        self._capture = DebugCapture(DEBUG_CAPTURE_RESPONSES, DEBUG_CAPTURE_SNAPSHOTS)
+
+    @property
+    def debug_capture(self) -> DebugCapture:
+        """Return the capture of the last requests and polls."""
+        return self._capture
+
+    @property
+    def skipped_datasets(self) -> frozenset:
+        """Return the datasets skipped for lack of enabled entities."""
+        return frozenset(self._skipped)
+
+    @property
+    def host(self) -> str:
+        """Return the address of the router."""
+        return self._host
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it when needed."""
+        if self._own_session and (self._session is None or self._session.closed):
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+            )
+        return self._session
+
+    async def async_close(self) -> None:
+        """Send pending writes and close the shared HTTP session."""
+        await self._write_queue.async_flush()
+        if not self._own_session:
+            return
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _record_status(self, status: int) -> None:
+        """Update the circuit breaker with the status of a router response.
+
+        Server errors mean an overloaded or failing router and count as
+        failures. Successful responses and authentication challenges show a
+        healthy router; other client errors leave the breaker unchanged.
+        """
+        if status >= 500:
+            self._breaker.record_failure()
+        elif status < 400 or status == 401:
+            self._breaker.record_success()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        json_data: Any = None,
+        timeout: Optional[float] = None,
+        probe: bool = False,
+    ) -> Any:
+        """Send a request to the router and return the decoded response.
+
+        Returns None when the router answers with a non-200 status, server
+        errors count as failures of the circuit breaker. Raises
+        KeeneticAuthError on 401 and KeeneticConnectionError when the router
+        cannot be reached or the circuit breaker is open; only probe requests
+        pass an open breaker.
+        """
+        if self._breaker.is_open and not probe:
+            raise KeeneticConnectionError(f"Circuit open for {self._host}")
+
+        if not self._auth_token and not probe:
+            if not await self.authenticate():
+                raise KeeneticConnectionError(f"Failed to authenticate with {self._host}")
+
+        headers = {"Authorization": f"Basic {self._auth_token}"}
+        request_timeout = aiohttp.ClientTimeout(total=timeout or REQUEST_TIMEOUT)
+        started = time.monotonic()
+
+        try:
+            async with self._get_session().request(
+                method,
+                f"{self._base_url}{path}",
+                headers=headers,
+                json=json_data,
+                timeout=request_timeout,
+            ) as response:
+                self._record_status(response.status)
+                data = None
+                if response.status == 200:
+                    data = await _safe_json_from_response(response)
+                self._capture.record_response(
+                    method, path, time.monotonic() - started,
+                    status=response.status, request=json_data, response=data,
+                )
+                if response.status == 401:
+                    self._auth_token = None
+                    raise KeeneticAuthError(f"Unauthorized request {path}")
+                return data
+        except (aiohttp.ClientError, TimeoutError) as ex:
+            self._breaker.record_failure()
+            self._capture.record_response(
+                method, path, time.monotonic() - started, request=json_data, error=repr(ex)
+            )
+            raise KeeneticConnectionError(f"Request {path} failed: {ex!r}") from ex
+
+    async def _probe(self) -> bool:
+        """Send a single cheap request to check whether the router answers."""
+        try:
+            await self._request("get", API_VERSION, timeout=PROBE_TIMEOUT, probe=True)
+            return True
+        except KeeneticAuthError:
+            return True
+        except KeeneticConnectionError:
+            return False
+
+    async def async_probe(self) -> dict:
+        """Check the credentials and return version information.
+
+        Sends a single version request with the configured credentials, which
+        is enough for the config flow to validate a router.
+        """
+        self._auth_token = self._get_auth_string()
+        data = await self._request("get", API_VERSION, timeout=PROBE_TIMEOUT, probe=True)
+        if not data:
+            raise KeeneticConnectionError("No version information received")
+        return self._format_version_info(data)
+
+    def _get_auth_string(self) -> str:
+        """Return the basic authentication string."""
+        return base64.b64encode(
+            f"{self._username}:{self._password}".encode()
+        ).decode()
 
     async def authenticate(self) -> bool:
         """Authenticate with the router."""
         try:
-            auth_string = base64.b64encode(
-                f"{self._username}:{self._password}".encode()
-            ).decode()
-
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self._base_url}/rci/",
-                    headers={"Authorization": f"Basic {auth_string}"},
-                ) as response:
-                    if response.status == 200:
-                        self._auth_token = auth_string
-                        return True
-                    return False
+            auth_string = self._get_auth_string()
+
+            async with self._get_session().get(
+                f"{self._base_url}/rci/",
+                headers={"Authorization": f"Basic {auth_string}"},
+            ) as response:
+                self._record_status(response.status)
+                if response.status == 200:
+                    self._auth_token = auth_string
+                    return True
+                return False
+        except (aiohttp.ClientError, TimeoutError) as ex:
+            self._breaker.record_failure()
+            _LOGGER.error("Authentication failed: %s", str(ex))
+            return False
         except Exception as ex:
             _LOGGER.error("Authentication failed: %s", str(ex))
             return False
 
     async def _get_system_info(self) -> dict:
         """Get system information."""
-        if not self._auth_token:
-            if not await self.authenticate():
-                return {}
-
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self._base_url}{API_SYSTEM}",
-                    headers={"Authorization": f"Basic {self._auth_token}"},
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        # memory =  disk not ram değil according to router Web interface
-                        memory_total = int(data.get("memtotal", 0))
-                        memory_free = int(data.get("memfree", 0))
-                        memory_usage = round((memory_total - memory_free) / memory_total * 100, 1) if memory_total > 0 else 0
-
-                        # ram
-                        mem_str = data.get("memory")
-                        ram_used, ram_total = map(int, mem_str.split("/"))
-                        ram_percent = round((ram_used / ram_total) * 100,1)
-
-                        return {
-                            "cpu_usage": data.get("cpuload", 0),
-                            "uptime": data.get("uptime", 0),
-                            "memory_usage": memory_usage,
-                            "memory_free": memory_free,
-                            "hostname": data.get("hostname", ""),
-                            "domainname": data.get("domainname", ""),
-                            "ram_usage": ram_percent
-                        }
-                    return {}
-        except Exception as ex:
-            _LOGGER.error("Error getting system info: %s", str(ex))
-            return {}
+        data = await self._request("get", API_SYSTEM)
+        if not data:
+            raise KeeneticConnectionError("No system information received")
+
+        # memory =  disk not ram değil according to router Web interface
+        memory_total = int(data.get("memtotal", 0))
+        memory_free = int(data.get("memfree", 0))
+        memory_usage = round((memory_total - memory_free) / memory_total * 100, 1) if memory_total > 0 else 0
+
+        # ram
+        mem_str = data.get("memory")
+        ram_used, ram_total = map(int, mem_str.split("/"))
+        ram_percent = round((ram_used / ram_total) * 100,1)
+
+        return {
+            "cpu_usage": data.get("cpuload", 0),
+            "uptime": data.get("uptime", 0),
+            "memory_usage": memory_usage,
+            "memory_free": memory_free,
+            "hostname": data.get("hostname", ""),
+            "domainname": data.get("domainname", ""),
+            "ram_usage": ram_percent
+        }
 
     async def _get_version_info(self) -> dict:
         """Get version information."""
-        if not self._auth_token:
-            if not await self.authenticate():
-                return {}
-
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self._base_url}{API_VERSION}",
-                    headers={"Authorization": f"Basic {self._auth_token}"},
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return {
-                            "firmware_version": data.get("title", ""),
-                            "firmware_branch": data.get("sandbox", ""),
-                            "model": data.get("model", ""),
-                            "device": data.get("device", ""),
-                            "manufacturer": data.get("manufacturer", MANUFACTURER),
-                            "hardware_version": data.get("hw_version", ""),
-                        }
-                    return {}
-        except Exception as ex:
-            _LOGGER.error("Error getting version info: %s", str(ex))
-            return {}
+        data = await self._request("get", API_VERSION)
+        if not data:
+            raise KeeneticConnectionError("No version information received")
+        return self._format_version_info(data)
+
+    @staticmethod
+    def _format_version_info(data: dict) -> dict:
+        """Format version information."""
+        return {
+            "firmware_version": data.get("title", ""),
+            "firmware_branch": data.get("sandbox", ""),
+            "model": data.get("model", ""),
+            "device": data.get("device", ""),
+            "manufacturer": data.get("manufacturer", MANUFACTURER),
+            "hardware_version": data.get("hw_version", ""),
+        }
 
     async def _get_interface_status(self) -> dict:
         """Get interface status."""
-        if not self._auth_token:
-            if not await self.authenticate():
-                return {}
-
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self._base_url}{API_INTERFACE}",
-                    headers={"Authorization": f"Basic {self._auth_token}"},
-                ) as response:
-                    if response.status == 200:
-                        data  = await _safe_json_from_response(response)
-                        #data = await response.json()
-                        #_LOGGER.warning("Raw interface data received: %s", data)
-                        return data
-                    return {}
-        except Exception as ex:
-            _LOGGER.error("Error getting interface status: %s", str(ex))
-            return {}
+        data = await self._request("get", API_INTERFACE)
+        if data is None:
+            raise KeeneticConnectionError("No interface status received")
+        return data
 
     async def _get_interface_statistics(self, interface_name: str) -> dict:
         """Get interface statistics."""
-        if not self._auth_token:
-            if not await self.authenticate():
-                return {}
+        return await self._request(
+            "get", f"/rci/show/interface/stat?name={interface_name}"
+        ) or {}
 
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self._base_url}/rci/show/interface/stat?name={interface_name}",
-                    headers={"Authorization": f"Basic {self._auth_token}"},
-                ) as response:
-                    if response.status == 200:
-                        return  await _safe_json_from_response(response)
-                        #return await response.json()
-                    return {}
-        except Exception as ex:
-            _LOGGER.error("Error getting interface statistics: %s", str(ex))
+    async def _get_statistics_batch(self, interface_names: list) -> dict:
+        """Get statistics of several interfaces in one request."""
+        if not interface_names:
             return {}
+        data = await self._request(
+            "post",
+            "/rci/",
+            json_data=[
+                {"show": {"interface": {"stat": {"name": name}}}}
+                for name in interface_names
+            ],
+        )
+        if not isinstance(data, list):
+            raise KeeneticConnectionError("No interface statistics received")
+        return {
+            name: (item or {}).get("show", {}).get("interface", {}).get("stat", {}) or {}
+            for name, item in zip(interface_names, data)
+        }
+
+    async def async_get_load_sample(self, interface_names: list) -> tuple[dict, dict]:
+        """Get system load and statistics of the given interfaces."""
+        system_info = await self._get_system_info()
+        statistics = await self._get_statistics_batch(interface_names)
+        return system_info, statistics
+
+    async def async_get_interface_sample(self, interface_name: str) -> dict:
+        """Get the statistics of a single interface."""
+        data = await self._request(
+            "get", f"/rci/show/interface/stat?name={interface_name}"
+        )
+        if data is None:
+            raise KeeneticConnectionError(f"No statistics received for {interface_name}")
+        return data
+
+    async def async_show(self, path: str) -> Any:
+        """Run a read-only RCI command given as a path starting with show."""
+        data = await self._request("get", f"/rci/{path}")
+        if data is None:
+            raise KeeneticConnectionError(f"No response received for {path}")
+        return data
+
+    async def async_get_node_resources(self) -> dict:
+        """Get load, port and access point statistics of a mesh extender."""
+        system_info = await self._get_system_info()
+        interface_info = await self._get_interface_status()
+
+        ports = {
+            port_id: port_data
+            for interface_data in interface_info.values()
+            if isinstance(interface_data.get("port"), dict)
+            for port_id, port_data in interface_data["port"].items()
+            if isinstance(port_data, dict) and port_data.get("type") == "Port"
+        }
+        access_points = {
+            interface_id: interface_data
+            for interface_id, interface_data in interface_info.items()
+            if interface_data.get("type") == "AccessPoint"
+        }
+        statistics = await self._get_statistics_batch([*ports, *access_points])
+
+        return {
+            "cpu_usage": system_info["cpu_usage"],
+            "ram_usage": system_info["ram_usage"],
+            "uptime": system_info["uptime"],
+            "ports": {
+                port_id: {
+                    "link": port_data.get("link", "down"),
+                    "speed": port_data.get("speed", "0"),
+                    "rx_speed": statistics.get(port_id, {}).get("rxspeed", 0),
+                    "tx_speed": statistics.get(port_id, {}).get("txspeed", 0),
+                }
+                for port_id, port_data in ports.items()
+            },
+            "access_points": {
+                ap_id: {
+                    "ssid": ap_data.get("ssid", ""),
+                    "state": ap_data.get("state", ""),
+                    "rx_speed": statistics.get(ap_id, {}).get("rxspeed", 0),
+                    "tx_speed": statistics.get(ap_id, {}).get("txspeed", 0),
+                }
+                for ap_id, ap_data in access_points.items()
+            },
+        }
 
     async def _get_mesh_info(self) -> list:
         """Get mesh network information."""
-        if not self._auth_token:
-            if not await self.authenticate():
-                return []
-
-        try:
-            async with aiohttp.ClientSession() as session:
-                url = f"{self._base_url}{API_MESH}"
-                _LOGGER.debug("Requesting mesh info from: %s", url)
-                async with session.get(
-                    url,
-                    headers={"Authorization": f"Basic {self._auth_token}"},
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        _LOGGER.debug("Raw mesh data received: %s", data)
-                        if isinstance(data, list):
-                            return data
-                        elif isinstance(data, dict) and "member" in data:
-                            return data["member"]
-                        return []
-                    return []
-        except Exception as ex:
-            _LOGGER.error("Error getting mesh info: %s", str(ex))
-            return []
+        data = await self._request("get", API_MESH)
+        if isinstance(data, list):
+            return data
+        elif isinstance(data, dict) and "member" in data:
+            return data["member"]
+        return []
+
+    async def _get_poll_interface_status(self) -> dict:
+        """Get the interface status fetched once for the current poll."""
+        return await asyncio.shield(self._interface_status)
+
+    async def _fetch_interfaces(self) -> dict:
+        """Fetch Ethernet ports and WAN connections with statistics."""
+        interface_info = await self._get_poll_interface_status()
+        return await EthernetProcessor.process_ethernet_ports(
+            interface_info,
+            self._get_interface_statistics
+        )
 
-    async def get_system_info(self) -> dict:
-        """Get system information for config flow."""
-        try:
-            data = await self.get_data()
-            
-            if not data:
-                raise Exception("Failed to get system information")
-    
-            return {
-                "device": data.get("device", "Router"),
-                "manufacturer": data.get("manufacturer", "Keenetic"),
-                "model": data.get("model", "Router"),
-                "firmware_version": data.get("firmware_version", ""),
-                "hardware_version": data.get("hardware_version", ""),
-                "cpu_usage": data.get("cpu_usage", 0)
+    async def _fetch_wifi(self) -> dict:
+        """Fetch WiFi access points with statistics."""
+        access_points = await WiFiProcessor.process_wifi_interfaces(self._request)
+        for ap_id, ap_data in access_points.items():
+            ap_stats = await self._get_interface_statistics(ap_id)
+            ap_data["attributes"] = {
+                "rx_speed": ap_stats.get("rxspeed", 0),
+                "tx_speed": ap_stats.get("txspeed", 0),
+                "rx_bytes": ap_stats.get("rxbytes", 0),
+                "tx_bytes": ap_stats.get("txbytes", 0),
             }
-        except Exception as ex:
-            _LOGGER.error("Error in get_system_info: %s", str(ex))
-            raise
+        return access_points
+
+    async def _fetch_associations(self) -> dict:
+        """Fetch stations associated with all access points."""
+        association_info = await self._request("get", API_ASSOCIATIONS)
+        if association_info is None:
+            raise KeeneticConnectionError("No association information received")
+        return WiFiProcessor.process_associations(association_info, WEAK_RSSI_THRESHOLD)
+
+    async def _fetch_mesh(self) -> dict:
+        """Fetch mesh nodes."""
+        mesh_info = await self._get_mesh_info()
+        return MeshProcessor.process_mesh_nodes(mesh_info)
+
+    async def _fetch_hosts(self) -> dict:
+        """Fetch the host table and compute top talkers."""
+        host_info = await self._request("get", API_HOSTS)
+        if host_info is None:
+            raise KeeneticConnectionError("No host information received")
+        return self._host_processor.process_hosts(host_info)
+
+    async def _fetch_processes(self) -> dict:
+        """Sample the process list when it is due and return the top CPU consumers.
+
+        The decision uses the CPU load of the previous poll, since the system
+        dataset of this poll is fetched concurrently.
+        """
+        cpu_usage = self._datasets.get("system", {}).get("cpu_usage")
+        if not self._process_processor.is_due(cpu_usage):
+            return self._process_processor.result
+        process_info = await self._request("get", API_PROCESSES)
+        if process_info is None:
+            raise KeeneticConnectionError("No process information received")
+        return self._process_processor.process_processes(process_info)
+
+    async def _fetch_latency(self) -> dict:
+        """Fetch ping-check results and update uplink latency statistics."""
+        ping_check_info = await self._request("get", API_PING_CHECK)
+        if ping_check_info is None:
+            raise KeeneticConnectionError("No ping-check information received")
+        return self._ping_check_processor.process_ping_check(ping_check_info)
+
+    async def _fetch_modems(self) -> dict:
+        """Fetch LTE and USB modems with statistics."""
+        interface_info = await self._get_poll_interface_status()
+        return await ModemProcessor.process_interfaces(interface_info, self._request)
+
+    async def _fetch_tunnels(self) -> dict:
+        """Fetch VPN tunnels with statistics and WireGuard peers."""
+        interface_info = await self._get_poll_interface_status()
+        return await TunnelProcessor.process_interfaces(interface_info, self._request)
+
+    def add_consumer(self, datasets: tuple) -> Callable[[], None]:
+        """Register an entity reading the given datasets, return its remover."""
+        self._consumers.update(datasets)
+
+        def remove_consumer() -> None:
+            self._consumers.subtract(datasets)
+
+        return remove_consumer
+
+    def has_consumers(self, dataset: str) -> bool:
+        """Return True if an enabled entity reads the dataset."""
+        return not self._track_consumers or self._consumers[dataset] > 0
+
+    def start_consumer_tracking(self) -> None:
+        """Fetch only the datasets read by enabled entities from now on.
+
+        Called once the platforms are set up, before that every dataset is
+        fetched so that all entities can be created.
+        """
+        self._track_consumers = True
+
+    def _select_fetchers(self, fetchers: dict) -> dict:
+        """Drop the fetchers of datasets without an enabled consumer."""
+        if not self._track_consumers:
+            return fetchers
+        skipped = {
+            name for name in fetchers
+            if name not in ALWAYS_FETCHED_DATASETS and self._consumers[name] <= 0
+        }
+        if skipped != self._skipped:
+            _LOGGER.debug("Skipping datasets without enabled entities: %s", sorted(skipped))
+            self._skipped = skipped
+        for name in skipped:
+            self._datasets.discard(name)
+        return {name: fetch for name, fetch in fetchers.items() if name not in skipped}
+
+    async def _refresh_datasets(self) -> None:
+        """Refresh all datasets in parallel, bounded by the poll deadline."""
+        fetchers = {
+            "system": self._get_system_info,
+            "version": self._get_version_info,
+            "interfaces": self._fetch_interfaces,
+            "wifi": self._fetch_wifi,
+            "associations": self._fetch_associations,
+            "mesh": self._fetch_mesh,
+            "modems": self._fetch_modems,
+            "tunnels": self._fetch_tunnels,
+            "hosts": self._fetch_hosts,
+            "latency": self._fetch_latency,
+            "processes": self._fetch_processes,
+        }
+        fetchers = self._select_fetchers(fetchers)
+        # Interfaces, modems and tunnels are all derived from the interface list
+        self._interface_status = None
+        if fetchers.keys() & {"interfaces", "modems", "tunnels"}:
+            self._interface_status = asyncio.create_task(
+                self._get_interface_status(), name=f"{DOMAIN}_interface_status"
+            )
+        tasks = {
+            name: asyncio.create_task(fetch(), name=f"{DOMAIN}_{name}")
+            for name, fetch in fetchers.items()
+        }
+        _, pending = await asyncio.wait(tasks.values(), timeout=POLL_DEADLINE)
+        if self._interface_status is not None and not self._interface_status.done():
+            pending.add(self._interface_status)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        for name, task in tasks.items():
+            if task in pending:
+                _LOGGER.warning("Fetching %s missed the poll deadline, serving last value", name)
+            elif task.exception() is not None:
+                _LOGGER.warning(
+                    "Fetching %s failed, serving last value: %s", name, task.exception()
+                )
+            else:
+                self._datasets.set(name, task.result())
 
     async def get_data(self) -> Dict[str, Any]:
         """Get all required data from router."""
-        try:
-            async with aiohttp.ClientSession() as session:
-                system_info = await self._get_system_info()
-                version_info = await self._get_version_info()
-                interface_info = await self._get_interface_status()
-                mesh_info = await self._get_mesh_info()
-
-                ethernet_interfaces = await EthernetProcessor.process_ethernet_ports(
-                    interface_info,
-                    self._get_interface_statistics
-                )
-
-                wifi_interfaces = await WiFiProcessor.process_wifi_interfaces(session,self._base_url,self._auth_token)
+        self._datasets.begin_poll()
+        started = time.monotonic()
 
-                mobile_interfaces = await MobileProcessor.process_interfaces(session,self._base_url,self._auth_token)
-
-                usb_modem_interfaces = await UsbModemProcessor.process_interfaces(session,self._base_url,self._auth_token)
-
-                all_interfaces = {
-                    **ethernet_interfaces,
-                    **wifi_interfaces,
-                    **mobile_interfaces,
-                    **usb_modem_interfaces
-                }
-                          
-                processed_mesh = MeshProcessor.process_mesh_nodes(mesh_info)
-
-                return {
-                    **system_info,
-                    **version_info,
-                    "interface": all_interfaces,
-                    "mesh": processed_mesh
-                }
+        if self._breaker.is_open and not await self._probe():
+            _LOGGER.debug("Router %s is still unreachable, skipping poll", self._host)
+            return {}
 
+        try:
+            await self._refresh_datasets()
         except Exception as ex:
             _LOGGER.error("Error getting data: %s", str(ex))
             return {}
 
+        if not self._datasets.has_fresh:
+            return {}
+
+        data = {
+            **self._datasets.get("system", {}),
+            **self._datasets.get("version", {}),
+            "interface": {
+                **self._datasets.get("interfaces", {}),
+                **self._datasets.get("wifi", {}),
+                **self._datasets.get("modems", {}),
+                **self._datasets.get("tunnels", {}),
+            },
+            "mesh": self._datasets.get("mesh", {}),
+            "hosts": self._datasets.get("hosts", {}),
+            "associations": self._datasets.get("associations", {}),
+            "latency": self._datasets.get("latency", {}),
+            "processes": self._datasets.get("processes", {}),
+            "datasets": self._datasets.status(),
+        }
+        self._capture.record_snapshot(time.monotonic() - started, data)
+        return data
+
     async def _get_wifi_interface_info(self, interface_name: str) -> dict:
         """Get detailed information about specific WiFi interface."""
-        if not self._auth_token:
-            if not await self.authenticate():
-                return {}
-    
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self._base_url}/rci/interface/{interface_name}",
-                    headers={"Authorization": f"Basic {self._auth_token}"},
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        _LOGGER.debug("WiFi interface data for %s: %s", interface_name, data)
-                        return data
-                    return {}
+            data = await self._request("get", f"/rci/interface/{interface_name}")
+            return data or {}
         except Exception as ex:
             _LOGGER.error("Error getting WiFi interface info: %s", str(ex))
             return {}
 
+    async def async_sync_wifi_schedule(self, ap_id: str, periods: list) -> int:
+        """Make the router schedule of an access point match the periods.
+
+        Returns the number of writes that were needed.
+        """
+        name = ScheduleSync.get_schedule_name(ap_id)
+        schedule_config = await self._request("get", f"/rci/schedule/{name}")
+        ap_config = await self._request("get", f"/rci/interface/{ap_id}")
+        if ap_config is None:
+            raise KeeneticConnectionError(f"No configuration received for {ap_id}")
+
+        writes = ScheduleSync.diff(
+            ap_id,
+            ScheduleSync.build_actions(periods),
+            ScheduleSync.parse_actions(schedule_config),
+            ap_config.get("schedule", ""),
+            # A missing schedule is answered with an error status
+            isinstance(schedule_config, dict) and "status" not in schedule_config,
+        )
+        results = await asyncio.gather(*(
+            self._write_queue.async_write(key, command) for key, command in writes
+        ))
+        if not all(results):
+            raise KeeneticConnectionError(f"Failed to write the schedule of {ap_id}")
+        return len(writes)
+
     async def enable_wifi(self, ap_id: str) -> bool:
         """Enable WiFi network."""
-        if not self._auth_token:
-            if not await self.authenticate():
-                return False
-    
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self._base_url}/rci/interface/{ap_id}",
-                    headers={
-                        "Authorization": f"Basic {self._auth_token}",
-                        "Content-Type": "application/json"
-                    },
-                    json={"up": "true"}
-                ) as response:
-                    return response.status == 200
-        except Exception as ex:
-            _LOGGER.error("Error enabling WiFi network: %s", str(ex))
-            return False
-    
+        return await self._write_queue.async_write(
+            ap_id, {"interface": {"name": ap_id, "up": "true"}}
+        )
+
     async def disable_wifi(self, ap_id: str) -> bool:
         """Disable WiFi network."""
-        if not self._auth_token:
-            if not await self.authenticate():
-                return False
-    
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self._base_url}/rci/interface/{ap_id}",
-                    headers={
-                        "Authorization": f"Basic {self._auth_token}",
-                        "Content-Type": "application/json"
-                    },
-                    json={"down": "true"}
-                ) as response:
-                    return response.status == 200
-        except Exception as ex:
-            _LOGGER.error("Error disabling WiFi network: %s", str(ex))
-            return False
+        return await self._write_queue.async_write(
+            ap_id, {"interface": {"name": ap_id, "down": "true"}}
+        )
\ No newline at end of file
@@ -0,0 +1,72 @@
+"""On-demand high resolution sampling of one Keenetic interface."""
+from __future__ import annotations
+import asyncio
+import logging
+import time
+from typing import Any, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import BURST_SAMPLE_INTERVAL, SIGNAL_BURST_SAMPLE
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BurstSampler:
+    """Poll the statistics of a single interface every second for a while.
+
+    Samples are published to the burst sensor through the dispatcher, the
+    coordinator schedule is not affected. Starting a new burst replaces the
+    running one, and a burst stops by itself when its duration ends.
+    """
+
+    def __init__(self, hass: HomeAssistant, api, entry_id: str) -> None:
+        """Initialize the sampler."""
+        self._hass = hass
+        self._api = api
+        self._signal = SIGNAL_BURST_SAMPLE.format(entry_id)
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self, interface_id: str, stat_name: str, duration: int) -> None:
+        """Start a burst on an interface, replacing the running one."""
+        self.stop()
+        self._task = self._hass.async_create_background_task(
+            self._async_run(interface_id, stat_name, duration),
+            f"Keenetic burst sample {interface_id}",
+        )
+
+    def stop(self) -> None:
+        """Stop the running burst, if any."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    def _publish(self, sample: dict[str, Any]) -> None:
+        """Send a sample to the burst sensor."""
+        async_dispatcher_send(self._hass, self._signal, sample)
+
+    async def _async_run(self, interface_id: str, stat_name: str, duration: int) -> None:
+        """Sample the interface until the duration ends."""
+        _LOGGER.debug("Burst sampling %s for %d seconds", interface_id, duration)
+        start = time.monotonic()
+        deadline = start + duration
+        next_sample = start
+        try:
+            while (now := time.monotonic()) < deadline:
+                try:
+                    stats = await self._api.async_get_interface_sample(stat_name)
+                except Exception as ex:
+                    _LOGGER.debug("Burst sample of %s failed: %s", interface_id, ex)
+                else:
+                    self._publish({
+                        "active": True,
+                        "interface": interface_id,
+                        "rx_speed": stats.get("rxspeed", 0),
+                        "tx_speed": stats.get("txspeed", 0),
+                        "remaining": round(deadline - now),
+                    })
+                next_sample += BURST_SAMPLE_INTERVAL
+                await asyncio.sleep(max(next_sample - time.monotonic(), 0))
+        finally:
+            self._publish({"active": False, "interface": interface_id})
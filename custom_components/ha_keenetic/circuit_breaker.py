@@ -0,0 +1,45 @@
+"""Circuit breaker for Keenetic router requests."""
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """Track consecutive request failures against a router.
+
+    The breaker opens after ``failure_threshold`` consecutive failures. While
+    open, callers should skip regular requests and only send a probe; any
+    successful response closes the breaker again.
+    """
+
+    def __init__(self, name: str, failure_threshold: int) -> None:
+        """Initialize the circuit breaker."""
+        self._name = name
+        self._failure_threshold = failure_threshold
+        self._failures = 0
+
+    @property
+    def is_open(self) -> bool:
+        """Return True if requests should fail fast."""
+        return self._failures >= self._failure_threshold
+
+    @property
+    def failures(self) -> int:
+        """Return the number of consecutive failures."""
+        return self._failures
+
+    def record_success(self) -> None:
+        """Record a request that reached the router."""
+        if self.is_open:
+            _LOGGER.info("Router %s is reachable again, closing circuit", self._name)
+        self._failures = 0
+
+    def record_failure(self) -> None:
+        """Record a request that did not reach the router."""
+        self._failures += 1
+        if self._failures == self._failure_threshold:
+            _LOGGER.warning(
+                "Router %s failed %d consecutive requests, opening circuit",
+                self._name,
+                self._failures,
+            )
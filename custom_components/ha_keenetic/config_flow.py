@@ -7,6 +7,7 @@ from homeassistant import config_entries
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.service_info.ssdp import SsdpServiceInfo
 import voluptuous as vol
 
@@ -18,17 +19,29 @@ from .const import (
     CONF_PORT,
     CONF_ENABLE_MESH,
     CONF_UPDATE_INTERVAL,
+    CONF_COUNTER_SENSORS,
+    CONF_CPU_DEADBAND,
+    CONF_RAM_DEADBAND,
+    CONF_SPEED_DEADBAND,
+    CONF_DEADBAND_HEARTBEAT,
+    CONF_SAMPLE_INTERVAL,
     DEFAULT_HOST,
     DEFAULT_PORT,
     DEFAULT_USERNAME,
     DEFAULT_ENABLE_MESH,
     DEFAULT_UPDATE_INTERVAL,
+    DEFAULT_COUNTER_SENSORS,
+    DEFAULT_CPU_DEADBAND,
+    DEFAULT_RAM_DEADBAND,
+    DEFAULT_SPEED_DEADBAND,
+    DEFAULT_DEADBAND_HEARTBEAT,
+    DEFAULT_SAMPLE_INTERVAL,
     ERROR_CANNOT_CONNECT,
     ERROR_INVALID_AUTH,
     ERROR_UNKNOWN,
     MANUFACTURER,
 )
-from .api import KeeneticAPI
+from .api import KeeneticAPI, KeeneticAuthError, KeeneticConnectionError
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -52,26 +65,22 @@ class KeeneticConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def async_validate_input(self, data: dict) -> bool:
         """Validate the user input allows us to connect."""
-        try:
-            api = KeeneticAPI(
-                host=data[CONF_HOST],
-                username=data[CONF_USERNAME],
-                password=data[CONF_PASSWORD],
-                port=data[CONF_PORT],
-            )
-
-            if not await api.authenticate():
-                raise InvalidAuth
-
-            system_info = await api.get_system_info()
-            if not system_info:
-                raise CannotConnect
+        api = KeeneticAPI(
+            host=data[CONF_HOST],
+            username=data[CONF_USERNAME],
+            password=data[CONF_PASSWORD],
+            port=data[CONF_PORT],
+            session=async_get_clientsession(self.hass),
+        )
 
+        try:
+            await api.async_probe()
             return True
 
-        except InvalidAuth:
-            # Re-raise to be caught by caller
-            raise
+        except KeeneticAuthError as error:
+            raise InvalidAuth from error
+        except KeeneticConnectionError as error:
+            raise CannotConnect from error
         except Exception as error:
             _LOGGER.exception("Unexpected exception during validation")
             raise CannotConnect from error
@@ -82,6 +91,10 @@ class KeeneticConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if not hostname:
             return self.async_abort(reason="no_host")
 
+        # Rediscovery of a configured router is answered from the config
+        # entries without contacting it
+        self._async_abort_entries_match({CONF_HOST: hostname})
+
         await self.async_set_unique_id(discovery_info.upnp.get("serialNumber", hostname))
         self._abort_if_unique_id_configured(updates={CONF_HOST: hostname})
 
@@ -181,6 +194,45 @@ class KeeneticOptionsFlow(config_entries.OptionsFlow):
                         vol.Coerce(int),
                         vol.Range(min=10, max=300)
                     ),
+                    vol.Required(
+                        CONF_COUNTER_SENSORS,
+                        default=options.get(CONF_COUNTER_SENSORS, DEFAULT_COUNTER_SENSORS),
+                    ): bool,
+                    vol.Required(
+                        CONF_CPU_DEADBAND,
+                        default=options.get(CONF_CPU_DEADBAND, DEFAULT_CPU_DEADBAND),
+                    ): vol.All(
+                        vol.Coerce(float),
+                        vol.Range(min=0, max=50)
+                    ),
+                    vol.Required(
+                        CONF_RAM_DEADBAND,
+                        default=options.get(CONF_RAM_DEADBAND, DEFAULT_RAM_DEADBAND),
+                    ): vol.All(
+                        vol.Coerce(float),
+                        vol.Range(min=0, max=50)
+                    ),
+                    vol.Required(
+                        CONF_SPEED_DEADBAND,
+                        default=options.get(CONF_SPEED_DEADBAND, DEFAULT_SPEED_DEADBAND),
+                    ): vol.All(
+                        vol.Coerce(float),
+                        vol.Range(min=0, max=100)
+                    ),
+                    vol.Required(
+                        CONF_DEADBAND_HEARTBEAT,
+                        default=options.get(CONF_DEADBAND_HEARTBEAT, DEFAULT_DEADBAND_HEARTBEAT),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=30, max=3600)
+                    ),
+                    vol.Required(
+                        CONF_SAMPLE_INTERVAL,
+                        default=options.get(CONF_SAMPLE_INTERVAL, DEFAULT_SAMPLE_INTERVAL),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=0, max=60)
+                    ),
                 }
             ),
         )
\ No newline at end of file
@@ -26,10 +26,61 @@ API_SYSTEM = "/rci/show/system"
 API_VERSION = "/rci/show/version"
 API_INTERFACE = "/rci/show/interface"
 API_MESH = "/rci/show/mws/member"
+API_HOSTS = "/rci/show/ip/hotspot"
+API_ASSOCIATIONS = "/rci/show/associations"
+API_PING_CHECK = "/rci/show/ping-check"
+API_PROCESSES = "/rci/show/processes"
 
 # Update interval
 UPDATE_INTERVAL = timedelta(seconds=30)
 
+# Request timeouts in seconds
+REQUEST_TIMEOUT = 10
+PROBE_TIMEOUT = 5
+
+# A poll serves the last good value of datasets that are not fetched within
+# the deadline, until they are older than the maximum age
+POLL_DEADLINE = 20
+DATASET_MAX_AGE = 300
+
+# Datasets fetched even without an enabled entity reading them
+ALWAYS_FETCHED_DATASETS = ("system", "version")
+
+# Top talkers: number of hosts exposed and seconds before a departed host
+# is forgotten
+TOP_TALKERS_COUNT = 5
+HOST_TTL = 600
+
+# Top processes: number exposed, seconds between samples of the process
+# list and total CPU load (percent) below which sampling pauses
+TOP_PROCESSES_COUNT = 5
+PROCESS_POLL_INTERVAL = 300
+PROCESS_CPU_THRESHOLD = 50
+
+# WiFi clients below this RSSI (dBm) are counted as weak
+WEAK_RSSI_THRESHOLD = -75
+
+# Consecutive failed requests before the circuit breaker opens
+CIRCUIT_BREAKER_THRESHOLD = 3
+
+# Configuration writes are batched after this many seconds without new writes
+WRITE_DELAY = 1
+
+# Debug capture: raw responses and processed polls kept for diagnostics
+DEBUG_CAPTURE_RESPONSES = 100
+DEBUG_CAPTURE_SNAPSHOTS = 3
+
+# Storage
+STORAGE_VERSION = 1
+STORAGE_KEY_TRAFFIC = "traffic"
+STORAGE_KEY_TOPOLOGY = "topology"
+
+# Traffic accounting, counters are flushed to disk at most once per delay
+TRAFFIC_SAVE_DELAY = 300
+
+# Topology is saved only when it changes, the delay merges bursts of changes
+TOPOLOGY_SAVE_DELAY = 30
+
 # Interface types
 INTERFACE_TYPE_WAN = "wan"
 INTERFACE_TYPE_PORT = "port"
@@ -48,6 +99,41 @@ ATTR_INTERFACE_ATTRIBUTES = "attributes"
 
 # Mesh constants
 MESH_NODE_PREFIX = "mesh_node_"
+# Nodes that left the mesh are dropped after this long (seconds)
+MESH_NODE_RETENTION = 86400
+
+# Events fired on state transitions between polls
+EVENT_LINK_CHANGED = f"{DOMAIN}_link_changed"
+EVENT_SSID_CHANGED = f"{DOMAIN}_ssid_changed"
+EVENT_MODEM_CHANGED = f"{DOMAIN}_modem_changed"
+EVENT_MESH_TOPOLOGY_CHANGED = f"{DOMAIN}_mesh_topology_changed"
+
+# Extenders are polled directly on their mesh address with the controller
+# credentials and port, a few at a time and less often than the controller
+# (seconds), only while a mesh resource sensor is enabled
+MESH_POLL_INTERVAL = 120
+MESH_POLL_CONCURRENCY = 4
+
+# Burst sampling polls one interface every second for a limited time (seconds)
+SERVICE_BURST_SAMPLE = "burst_sample"
+BURST_SAMPLE_INTERVAL = 1
+DEFAULT_BURST_DURATION = 120
+MAX_BURST_DURATION = 600
+SIGNAL_BURST_SAMPLE = f"{DOMAIN}_burst_sample_{{}}"
+
+# WiFi schedules are enforced by the router, only differences are written
+SERVICE_SET_WIFI_SCHEDULE = "set_wifi_schedule"
+
+# Read-only RCI queries, cached per command for the requested TTL and sent
+# to the router at most once per minimum interval, with all queries spaced
+# by the request spacing (seconds)
+SERVICE_RCI = "rci"
+DEFAULT_RCI_TTL = 30
+RCI_MIN_INTERVAL = 5
+RCI_REQUEST_SPACING = 0.5
+RCI_CACHE_SIZE = 64
+RCI_RESULTS_SIZE = 16
+SIGNAL_RCI_RESULT = f"{DOMAIN}_rci_result_{{}}"
 
 # Platforms
 PLATFORMS = ["sensor", "switch"]
@@ -55,6 +141,28 @@ PLATFORMS = ["sensor", "switch"]
 
 CONF_ENABLE_MESH = "enable_mesh"
 CONF_UPDATE_INTERVAL = "update_interval"
+CONF_COUNTER_SENSORS = "counter_sensors"
+CONF_CPU_DEADBAND = "cpu_deadband"
+CONF_RAM_DEADBAND = "ram_deadband"
+CONF_SPEED_DEADBAND = "speed_deadband"
+CONF_DEADBAND_HEARTBEAT = "deadband_heartbeat"
+CONF_SAMPLE_INTERVAL = "sample_interval"
 
 DEFAULT_ENABLE_MESH = True
 DEFAULT_UPDATE_INTERVAL = 30
+DEFAULT_COUNTER_SENSORS = False
+
+# Deadbands: CPU and RAM in percentage points, speeds in percent of the last
+# published value. A value is written at least once per heartbeat (seconds).
+DEFAULT_CPU_DEADBAND = 2
+DEFAULT_RAM_DEADBAND = 1
+DEFAULT_SPEED_DEADBAND = 10
+DEFAULT_DEADBAND_HEARTBEAT = 300
+
+# In-memory history: samples kept per metric and interfaces recorded per router
+HISTORY_SIZE = 120
+HISTORY_MAX_INTERFACES = 64
+
+# Windowed aggregation samples load and rates every interval (seconds)
+# between polls, 0 disables it
+DEFAULT_SAMPLE_INTERVAL = 0
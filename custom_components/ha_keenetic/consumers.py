@@ -0,0 +1,36 @@
+"""Dataset consumers of Keenetic entities."""
+from __future__ import annotations
+from typing import Any
+
+from .const import DOMAIN
+from .modem_processor import MODEM_TYPES
+
+
+def get_interface_dataset(interface_id: str, interface_data: dict[str, Any]) -> str:
+    """Return the dataset an interface record is fetched with."""
+    interface_type = interface_data.get("type", "")
+    if interface_type == "AccessPoint":
+        return "wifi"
+    if interface_type == "tunnel":
+        return "tunnels"
+    if interface_type in MODEM_TYPES or interface_id.startswith(tuple(MODEM_TYPES)):
+        return "modems"
+    return "interfaces"
+
+
+class DatasetConsumer:
+    """Mixin registering the datasets an entity reads with the API.
+
+    Only entities added to Home Assistant register, so datasets read by
+    disabled entities alone are not fetched. Enabling an entity reloads the
+    config entry and registers it again.
+    """
+
+    _datasets: tuple[str, ...] = ()
+
+    async def async_added_to_hass(self) -> None:
+        """Register the datasets of the entity."""
+        await super().async_added_to_hass()
+        if self._datasets:
+            api = self.hass.data[DOMAIN][self._config_entry.entry_id]["api"]
+            self.async_on_remove(api.add_consumer(self._datasets))
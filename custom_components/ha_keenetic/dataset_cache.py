@@ -0,0 +1,63 @@
+"""Last known good values of polled datasets."""
+import time
+from typing import Dict, Any
+
+
+class DatasetCache:
+    """Keep the last successful result of every dataset with its age.
+
+    A dataset that fails or misses the poll deadline keeps serving its last
+    value, marked stale, until it is older than ``max_age`` seconds.
+    """
+
+    def __init__(self, max_age: float) -> None:
+        """Initialize the cache."""
+        self._max_age = max_age
+        self._values: Dict[str, Any] = {}
+        self._updated: Dict[str, float] = {}
+        self._fresh: set[str] = set()
+
+    def begin_poll(self) -> None:
+        """Forget which datasets were refreshed by the previous poll."""
+        self._fresh.clear()
+
+    def set(self, name: str, value: Any) -> None:
+        """Store a fresh value for a dataset."""
+        self._values[name] = value
+        self._updated[name] = time.monotonic()
+        self._fresh.add(name)
+
+    def discard(self, name: str) -> None:
+        """Forget a dataset that is no longer polled."""
+        self._values.pop(name, None)
+        self._updated.pop(name, None)
+        self._fresh.discard(name)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Return the last value of a dataset unless it expired."""
+        age = self.age(name)
+        if age is None or age > self._max_age:
+            return default
+        return self._values[name]
+
+    def age(self, name: str) -> float | None:
+        """Return seconds since the dataset was last refreshed."""
+        if name not in self._updated:
+            return None
+        return time.monotonic() - self._updated[name]
+
+    @property
+    def has_fresh(self) -> bool:
+        """Return True if at least one dataset was refreshed by this poll."""
+        return bool(self._fresh)
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """Return age, staleness and expiry of every known dataset."""
+        return {
+            name: {
+                "age": round(self.age(name), 1),
+                "stale": name not in self._fresh,
+                "expired": self.age(name) > self._max_age,
+            }
+            for name in self._updated
+        }
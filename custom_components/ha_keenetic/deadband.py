@@ -0,0 +1,89 @@
+"""Deadband publishing for noisy Keenetic metrics."""
+from __future__ import annotations
+from dataclasses import dataclass
+import time
+from typing import Any
+
+from .const import (
+    CONF_CPU_DEADBAND,
+    CONF_RAM_DEADBAND,
+    CONF_SPEED_DEADBAND,
+    CONF_DEADBAND_HEARTBEAT,
+    DEFAULT_CPU_DEADBAND,
+    DEFAULT_RAM_DEADBAND,
+    DEFAULT_SPEED_DEADBAND,
+    DEFAULT_DEADBAND_HEARTBEAT,
+)
+
+
+@dataclass(frozen=True)
+class Deadband:
+    """Minimum change of a metric worth publishing.
+
+    ``absolute`` is a delta in the unit of the metric, ``relative`` a
+    fraction of the last published value. The larger of the two applies.
+    """
+    absolute: float = 0
+    relative: float = 0
+    heartbeat: float = DEFAULT_DEADBAND_HEARTBEAT
+
+
+class DeadbandFilter:
+    """Decide whether a new value of a metric should be written to HA."""
+
+    def __init__(self, deadband: Deadband) -> None:
+        """Initialize the filter."""
+        self._deadband = deadband
+        self._published: Any = None
+        self._published_at: float | None = None
+
+    def reset(self) -> None:
+        """Forget the published value, the next value is always published."""
+        self._published = None
+        self._published_at = None
+
+    def should_publish(self, value: Any, peak: Any = None) -> bool:
+        """Return True and remember the value if it should be published.
+
+        ``peak`` is the maximum seen since the last poll, if known; a peak
+        outside the band is published too so short spikes are not hidden.
+        """
+        now = time.monotonic()
+        if self._publish_needed(value, now) or (
+            peak is not None and self._publish_needed(peak, now)
+        ):
+            self._published = value
+            self._published_at = now
+            return True
+        return False
+
+    def _publish_needed(self, value: Any, now: float) -> bool:
+        """Return True if the value left the band or the heartbeat expired."""
+        if self._published_at is None or self._published is None or value is None:
+            return True
+        if now - self._published_at >= self._deadband.heartbeat:
+            return True
+        try:
+            delta = abs(float(value) - float(self._published))
+            band = max(
+                self._deadband.absolute,
+                self._deadband.relative * abs(float(self._published)),
+            )
+        except (TypeError, ValueError):
+            return value != self._published
+        return delta > band
+
+
+def build_deadbands(options: dict) -> dict[str, Deadband]:
+    """Return deadbands per metric key from the config entry options."""
+    heartbeat = options.get(CONF_DEADBAND_HEARTBEAT, DEFAULT_DEADBAND_HEARTBEAT)
+    cpu = options.get(CONF_CPU_DEADBAND, DEFAULT_CPU_DEADBAND)
+    ram = options.get(CONF_RAM_DEADBAND, DEFAULT_RAM_DEADBAND)
+    speed = options.get(CONF_SPEED_DEADBAND, DEFAULT_SPEED_DEADBAND) / 100
+
+    return {
+        "cpu_usage": Deadband(absolute=cpu, heartbeat=heartbeat),
+        "ram_usage": Deadband(absolute=ram, heartbeat=heartbeat),
+        "rx_speed": Deadband(relative=speed, heartbeat=heartbeat),
+        "tx_speed": Deadband(relative=speed, heartbeat=heartbeat),
+    }
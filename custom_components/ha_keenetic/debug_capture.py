@@ -0,0 +1,60 @@
+"""Bounded capture of router traffic for diagnostics."""
+from __future__ import annotations
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any
+
+
+class DebugCapture:
+    """Keep the last raw responses and processed snapshots of a router.
+
+    Recording stores references to the decoded payloads with their timings,
+    nothing is copied or formatted while polling. Payloads are only rendered
+    when diagnostics are downloaded, where secrets are redacted.
+    """
+
+    def __init__(self, responses: int, snapshots: int) -> None:
+        """Initialize the capture."""
+        self._responses: deque[dict[str, Any]] = deque(maxlen=responses)
+        self._snapshots: deque[dict[str, Any]] = deque(maxlen=snapshots)
+
+    def record_response(
+        self,
+        method: str,
+        path: str,
+        duration: float,
+        status: int | None = None,
+        request: Any = None,
+        response: Any = None,
+        error: str | None = None,
+    ) -> None:
+        """Record one request to the router."""
+        self._responses.append({
+            "time": datetime.now(timezone.utc),
+            "method": method.upper(),
+            "path": path,
+            "duration_ms": round(duration * 1000, 1),
+            "status": status,
+            "request": request,
+            "response": response,
+            "error": error,
+        })
+
+    def record_snapshot(self, duration: float, data: dict[str, Any]) -> None:
+        """Record the processed data of one poll."""
+        self._snapshots.append({
+            "time": datetime.now(timezone.utc),
+            "duration_ms": round(duration * 1000, 1),
+            "data": data,
+        })
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the captured responses and snapshots, oldest first."""
+        return {
+            "responses": [
+                {**entry, "time": entry["time"].isoformat()} for entry in self._responses
+            ],
+            "snapshots": [
+                {**entry, "time": entry["time"].isoformat()} for entry in self._snapshots
+            ],
+        }
@@ -34,7 +34,9 @@ class EthernetProcessor:
                         port_data = interface_data.get("port", {})
                         processed_ports[interface_id] = {
                             "id": interface_id,
+                            "stat_name": interface_id,
                             "type": "wan",
+                            "uplink": True,
                             "description": interface_data.get("description", ""),
                             "label": "LAN:" + interface_data.get("description", "") ,
                             "link": interface_data.get("link", "down"),
@@ -56,6 +58,7 @@ class EthernetProcessor:
                                 port_stats = await get_statistics_fn(port_id)
                                 processed_ports[port_interface_id] = {
                                     "id": port_interface_id,
+                                    "stat_name": port_id,
                                     "type": "port",
                                     "description": port_data.get("description", ""),
                                     "label": f"Port {port_data.get('label', port_id)}",
@@ -70,14 +73,14 @@ class EthernetProcessor:
                                         "tx_bytes": port_stats.get("txbytes", 0)
                                     }
                                 }
-                except Exception as ex:
+                except (AttributeError, KeyError, TypeError) as ex:
                     #_LOGGER.debug("Error Processing interface: %s -- %s", interface_id,interface_data)
                     continue
 
 
-            _LOGGER.debug("Processed Ethernet ports: %s", processed_ports)
+            _LOGGER.debug("Processed Ethernet ports: %s", list(processed_ports))
             return processed_ports
             
         except Exception as ex:
-            _LOGGER.error("Error processing Ethernet ports: %s", str(ex))
-            return {}
\ No newline at end of file
+            _LOGGER.debug("Error processing Ethernet ports: %s", str(ex))
+            raise
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""LAN host traffic processor for Keenetic integration."""
+import heapq
+import logging
+import time
+from typing import Dict, Any, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class HostProcessor:
+    """Compute per-host rates from the router host table.
+
+    Counters of every host are kept between polls to derive rates. Hosts that
+    were not seen for ``ttl`` seconds are evicted, and only the ``top_count``
+    busiest hosts are returned, selected with a bounded heap.
+    """
+
+    def __init__(self, top_count: int, ttl: float) -> None:
+        """Initialize the processor."""
+        self._top_count = top_count
+        self._ttl = ttl
+        self._hosts: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def _rate(last: Optional[int], current: int, elapsed: float) -> float:
+        """Return bytes per second between two counter values."""
+        if last is None or current < last or elapsed <= 0:
+            return 0.0
+        return (current - last) / elapsed
+
+    def process_hosts(self, host_info: dict) -> Dict[str, Any]:
+        """Process the host table and return the top talkers."""
+        now = time.monotonic()
+        hosts = host_info.get("host", []) if isinstance(host_info, dict) else host_info or []
+
+        for host in hosts:
+            mac = host.get("mac")
+            if not mac:
+                continue
+            try:
+                rx_bytes = int(host.get("rxbytes", 0))
+                tx_bytes = int(host.get("txbytes", 0))
+            except (TypeError, ValueError):
+                continue
+
+            state = self._hosts.get(mac)
+            if state is None:
+                state = self._hosts[mac] = {"rx_rate": 0.0, "tx_rate": 0.0}
+            else:
+                elapsed = now - state["seen"]
+                state["rx_rate"] = self._rate(state["rx_bytes"], rx_bytes, elapsed)
+                state["tx_rate"] = self._rate(state["tx_bytes"], tx_bytes, elapsed)
+
+            state.update({
+                "rx_bytes": rx_bytes,
+                "tx_bytes": tx_bytes,
+                "seen": now,
+                "name": host.get("name") or host.get("hostname") or mac,
+                "ip": host.get("ip", ""),
+            })
+
+        for mac in [mac for mac, state in self._hosts.items() if now - state["seen"] > self._ttl]:
+            del self._hosts[mac]
+
+        top = heapq.nlargest(
+            self._top_count,
+            self._hosts.items(),
+            key=lambda item: item[1]["rx_rate"] + item[1]["tx_rate"],
+        )
+
+        return {
+            "host_count": len(self._hosts),
+            "top_talkers": [
+                {
+                    "mac": mac,
+                    "name": state["name"],
+                    "ip": state["ip"],
+                    "rx_rate": round(state["rx_rate"]),
+                    "tx_rate": round(state["tx_rate"]),
+                    "rate": round(state["rx_rate"] + state["tx_rate"]),
+                }
+                for mac, state in top
+            ],
+        }
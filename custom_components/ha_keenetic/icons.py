@@ -5,6 +5,7 @@ ICON_CPU = "mdi:cpu-64-bit"
 ICON_MEMORY = "mdi:memory"
 ICON_UPTIME = "mdi:clock-outline"
 ICON_LOAD = "mdi:chart-line"
+ICON_PROCESS = "mdi:cog-box"
 
 # Device icons
 ICON_ROUTER = "mdi:router"
@@ -21,8 +22,12 @@ ICON_NETWORK = "mdi:network"
 ICON_WIFI = "mdi:wifi"
 ICON_WIFI_OFF = "mdi:wifi-off"
 ICON_WIFI_STRENGTH = "mdi:wifi-strength-4"
+ICON_WIFI_CLIENTS = "mdi:account-multiple"
+ICON_WIFI_WEAK = "mdi:wifi-strength-1-alert"
 ICON_MOBILE = "mdi:sim"
 ICON_MOBILE_OFF = "mdi:sim-off"
+ICON_LATENCY = "mdi:timer-sync-outline"
+ICON_PACKET_LOSS = "mdi:lan-disconnect"
 
 # Status icons
 ICON_ONLINE = "mdi:check-circle"
@@ -55,6 +60,8 @@ ICON_TRAFFIC = "mdi:transit-connection-variant"
 ICON_SECURITY = "mdi:security"
 ICON_FIREWALL = "mdi:shield"
 ICON_VPN = "mdi:vpn"
+ICON_VPN_OFF = "mdi:shield-off-outline"
+ICON_HANDSHAKE = "mdi:handshake-outline"
 ICON_LOCK = "mdi:lock"
 ICON_UNLOCK = "mdi:lock-open"
 
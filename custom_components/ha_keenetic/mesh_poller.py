@@ -0,0 +1,120 @@
+"""Resource polling of Keenetic mesh extenders."""
+from __future__ import annotations
+import asyncio
+from datetime import timedelta
+import logging
+from typing import Dict, Any, Callable
+
+from homeassistant.core import HomeAssistant, CALLBACK_TYPE
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_track_time_interval
+
+from .api import KeeneticAPI
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class MeshNodePoller:
+    """Poll CPU, RAM, port and access point statistics of mesh extenders.
+
+    Extenders are polled in parallel, at most ``concurrency`` at a time, on
+    their own schedule so a slow extender never delays the controller poll.
+    A node whose poll fails is left out of the results until it answers again.
+    Extenders use the port of the controller and share the Home Assistant
+    HTTP session. Polls are skipped while ``is_needed_fn`` returns False.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        username: str,
+        password: str,
+        port: int,
+        interval: int,
+        concurrency: int,
+        is_needed_fn: Callable[[], bool],
+    ) -> None:
+        """Initialize the poller."""
+        self._hass = hass
+        self._username = username
+        self._password = password
+        self._port = port
+        self._is_needed_fn = is_needed_fn
+        self._interval = interval
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._nodes: Dict[str, KeeneticAPI] = {}
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._polling = False
+
+    @property
+    def results(self) -> Dict[str, Dict[str, Any]]:
+        """Return the latest resources per mesh node."""
+        return dict(self._results)
+
+    def start(self) -> CALLBACK_TYPE:
+        """Start polling, return a callback that stops it."""
+        self._hass.async_create_background_task(
+            self._async_poll(), "Keenetic mesh node first poll"
+        )
+        return async_track_time_interval(
+            self._hass,
+            self._async_poll,
+            timedelta(seconds=self._interval),
+            name="Keenetic mesh node poller",
+        )
+
+    def track(self, nodes: Dict[str, Any]) -> None:
+        """Set the extenders to poll from the latest mesh data."""
+        addresses = {
+            node_id: node_data.get("attributes", {}).get("ip")
+            for node_id, node_data in nodes.items()
+            if node_data.get("status") == "connected"
+            and node_data.get("attributes", {}).get("ip")
+        }
+        for node_id in list(self._nodes):
+            if addresses.get(node_id) != self._nodes[node_id].host:
+                del self._nodes[node_id]
+                self._results.pop(node_id, None)
+        for node_id, address in addresses.items():
+            if node_id not in self._nodes:
+                self._nodes[node_id] = KeeneticAPI(
+                    host=address,
+                    username=self._username,
+                    password=self._password,
+                    port=self._port,
+                    session=async_get_clientsession(self._hass),
+                )
+
+    async def _async_poll_node(self, node_id: str, api: KeeneticAPI) -> None:
+        """Poll one extender."""
+        async with self._semaphore:
+            try:
+                resources = await api.async_get_node_resources()
+            except Exception as ex:
+                _LOGGER.debug("Polling mesh node %s failed: %s", node_id, ex)
+                self._results.pop(node_id, None)
+                return
+        # The node may have left while it was being polled
+        if self._nodes.get(node_id) is api:
+            self._results[node_id] = resources
+
+    async def _async_poll(self, now=None) -> None:
+        """Poll every tracked extender."""
+        if not self._is_needed_fn():
+            self._results.clear()
+            return
+        if self._polling or not self._nodes:
+            return
+        self._polling = True
+        try:
+            await asyncio.gather(*(
+                self._async_poll_node(node_id, api)
+                for node_id, api in list(self._nodes.items())
+            ))
+        finally:
+            self._polling = False
+
+    async def async_close(self) -> None:
+        """Forget all extenders, the shared session stays open."""
+        self._nodes.clear()
+        self._results.clear()
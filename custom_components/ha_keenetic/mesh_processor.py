@@ -7,6 +7,20 @@ _LOGGER = logging.getLogger(__name__)
 class MeshProcessor:
     """Process mesh network data from Keenetic router."""
 
+    @staticmethod
+    def _process_backhaul(backhaul: dict) -> Dict[str, Any]:
+        """Return the uplink of a mesh node."""
+        if not isinstance(backhaul, dict):
+            backhaul = {}
+        uplink = backhaul.get("uplink", "")
+        return {
+            "uplink": uplink,
+            "parent": backhaul.get("parent", ""),
+            "wireless": uplink.startswith("WifiMaster"),
+            "speed": backhaul.get("speed"),
+            "rssi": backhaul.get("rssi"),
+        }
+
     @staticmethod
     def process_mesh_nodes(mesh_info: list) -> Dict[str, Any]:
         """Process mesh nodes and return formatted data."""
@@ -22,6 +36,7 @@ class MeshProcessor:
                             "hostname": node.get("hostname", ""),
                             "model": node.get("model", ""),
                             "status": "connected",
+                            "backhaul": MeshProcessor._process_backhaul(node.get("backhaul", {})),
                             "attributes": {
                                 "ip": node.get("ip", ""),
                                 "mode": node.get("mode", ""),
@@ -37,7 +52,7 @@ class MeshProcessor:
                             }
                         }
             
-            _LOGGER.debug("Processed mesh nodes: %s", processed_mesh)
+            _LOGGER.debug("Processed mesh nodes: %s", list(processed_mesh))
             return processed_mesh
             
         except Exception as ex:
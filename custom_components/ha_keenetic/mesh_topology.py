@@ -0,0 +1,171 @@
+"""Mesh topology model for Keenetic integration."""
+import logging
+import time
+from typing import Dict, Any, List, Optional, Set
+
+_LOGGER = logging.getLogger(__name__)
+
+CONTROLLER = "controller"
+
+
+class MeshTopology:
+    """Keep the mesh graph between polls and update it incrementally.
+
+    Every extender is attached to its backhaul parent, which is the
+    controller unless the backhaul names another known extender. Hop counts
+    are only recomputed for the subtrees whose edges changed, and nodes that
+    left the member list are kept as disconnected for ``retention`` seconds
+    instead of disappearing at once.
+    """
+
+    def __init__(self, retention: float) -> None:
+        """Initialize the topology."""
+        self._retention = retention
+        self._nodes: Dict[str, Dict[str, Any]] = {}
+        self._parents: Dict[str, str] = {}
+        self._left: Dict[str, float] = {}
+        self._known = False
+
+    @property
+    def nodes(self) -> Dict[str, Dict[str, Any]]:
+        """Return the node records with precomputed topology."""
+        return dict(self._nodes)
+
+    @property
+    def unconfirmed_nodes(self) -> Dict[str, Dict[str, Any]]:
+        """Return the node records with the status of connected nodes unknown.
+
+        Used once the member list expired, when nothing confirms them anymore.
+        """
+        return {
+            node_id: {**node, "status": "unknown"} if node.get("status") == "connected" else node
+            for node_id, node in self._nodes.items()
+        }
+
+    def seed(self, nodes: Dict[str, Dict[str, Any]]) -> None:
+        """Load a previously known topology without reporting changes."""
+        self._known = True
+        self._nodes = {node_id: dict(node) for node_id, node in nodes.items()}
+        self._parents = {
+            node_id: node["topology"]["parent"]
+            for node_id, node in self._nodes.items()
+            if node.get("topology")
+        }
+        # The time they left is not stored, the retention starts over
+        now = time.monotonic()
+        self._left = {
+            node_id: now
+            for node_id, node in self._nodes.items()
+            if node.get("status") == "disconnected"
+        }
+
+    def _resolve_parent(self, node_id: str, node: Dict[str, Any], members: Dict[str, Any]) -> str:
+        """Return the id of the node the given node is attached to."""
+        parent = node.get("backhaul", {}).get("parent", "")
+        if parent and parent != node_id and parent in members:
+            return parent
+        return CONTROLLER
+
+    def _hops(self, node_id: str, memo: Dict[str, Optional[int]]) -> Optional[int]:
+        """Return the number of backhaul hops between a node and the controller."""
+        path: List[str] = []
+        current = node_id
+        while current != CONTROLLER and current not in memo:
+            if current in path or current not in self._parents:
+                # A loop or a dangling parent, the path cannot be resolved
+                hops = None
+                break
+            path.append(current)
+            current = self._parents[current]
+        else:
+            hops = 0 if current == CONTROLLER else memo[current]
+
+        for hop_node in reversed(path):
+            hops = None if hops is None else hops + 1
+            memo[hop_node] = hops
+        return memo.get(node_id, hops)
+
+    def _descendants(self, roots: Set[str]) -> Set[str]:
+        """Return the given nodes and every node attached below them."""
+        children: Dict[str, List[str]] = {}
+        for node_id, parent in self._parents.items():
+            children.setdefault(parent, []).append(node_id)
+        result = set()
+        pending = list(roots)
+        while pending:
+            node_id = pending.pop()
+            if node_id in result:
+                continue
+            result.add(node_id)
+            pending.extend(children.get(node_id, []))
+        return result
+
+    def update(self, members: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Apply the current member list and return the topology changes."""
+        changes: List[Dict[str, Any]] = []
+        dirty: Set[str] = set()
+        now = time.monotonic()
+
+        for node_id, node in members.items():
+            known = self._nodes.get(node_id)
+            self._left.pop(node_id, None)
+            parent = self._resolve_parent(node_id, node, members)
+
+            if known is None:
+                changes.append({"change": "node_joined", "node_id": node_id})
+            elif known.get("status") != "connected":
+                changes.append({"change": "node_reconnected", "node_id": node_id})
+
+            if self._parents.get(node_id) != parent or (
+                known is not None
+                and known.get("backhaul", {}).get("uplink") != node["backhaul"]["uplink"]
+            ):
+                if node_id in self._parents:
+                    changes.append({
+                        "change": "backhaul_changed",
+                        "node_id": node_id,
+                        "parent": parent,
+                        "uplink": node["backhaul"]["uplink"],
+                    })
+                self._parents[node_id] = parent
+                dirty.add(node_id)
+
+            record = {**node, "topology": known.get("topology") if known else None}
+            if record != known:
+                self._nodes[node_id] = record
+
+        for node_id, node in self._nodes.items():
+            if node_id not in members and node.get("status") != "disconnected":
+                self._nodes[node_id] = {**node, "status": "disconnected"}
+                self._left[node_id] = now
+                changes.append({"change": "node_left", "node_id": node_id})
+
+        for node_id, left in list(self._left.items()):
+            if now - left >= self._retention:
+                del self._nodes[node_id]
+                del self._left[node_id]
+                self._parents.pop(node_id, None)
+                changes.append({"change": "node_removed", "node_id": node_id})
+
+        if dirty:
+            memo: Dict[str, Optional[int]] = {}
+            for node_id in self._descendants(dirty):
+                node = self._nodes[node_id]
+                backhaul = node.get("backhaul", {})
+                self._nodes[node_id] = {
+                    **node,
+                    "topology": {
+                        "parent": self._parents[node_id],
+                        "hops": self._hops(node_id, memo),
+                        "uplink": backhaul.get("uplink", ""),
+                        "wireless": backhaul.get("wireless", False),
+                    },
+                }
+
+        if not self._known:
+            # The first member list establishes the topology, nothing changed
+            self._known = True
+            return []
+        if changes:
+            _LOGGER.debug("Mesh topology changed: %s", changes)
+        return changes
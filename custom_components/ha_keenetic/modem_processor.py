@@ -0,0 +1,113 @@
+"""Modem processor for Keenetic integration."""
+import logging
+from typing import Dict, Any, Callable, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+# Interface types of modems and the prefix of their description
+MODEM_TYPES = {
+    "UsbLte": "Internal SIM:",
+    "UsbModem": "USB Modem:",
+    "UsbQmi": "USB Modem:",
+}
+
+# Radio metrics published per modem, with the names firmwares report them under
+SIGNAL_KEYS = {
+    "rssi": ("rssi",),
+    "rsrp": ("rsrp",),
+    "rsrq": ("rsrq",),
+    "sinr": ("sinr", "cinr"),
+    "band": ("band",),
+    "cell_id": ("cell-id", "cellid"),
+    "temperature": ("temperature",),
+}
+
+
+class ModemProcessor:
+    """Process LTE and USB modems from Keenetic router.
+
+    Modems are discovered from the interface list, then the details and
+    statistics of all of them are fetched with one batched request.
+    """
+
+    @staticmethod
+    def _get_modem_type(interface_id: str, interface_data: dict) -> Optional[str]:
+        """Return the modem type of an interface, None if it is not a modem."""
+        interface_type = interface_data.get("type", "")
+        if interface_type in MODEM_TYPES:
+            return interface_type
+        return next((t for t in MODEM_TYPES if interface_id.startswith(t)), None)
+
+    @staticmethod
+    def _get_signal(master_data: dict) -> Dict[str, Any]:
+        """Return the radio metrics reported by a modem."""
+        signal = {}
+        for key, names in SIGNAL_KEYS.items():
+            value = next((master_data[name] for name in names if name in master_data), None)
+            if value is not None:
+                signal[key] = value
+        return signal
+
+    @staticmethod
+    async def process_interfaces(interface_info: dict, request_fn: Callable) -> Dict[str, Any]:
+        """Process modem interfaces and return formatted data."""
+        modem_data = {}
+
+        try:
+            modems = {
+                interface_id: modem_type
+                for interface_id, interface_data in interface_info.items()
+                if (modem_type := ModemProcessor._get_modem_type(interface_id, interface_data))
+            }
+            if not modems:
+                return modem_data
+
+            commands = []
+            for modem_id in modems:
+                commands.append({"show": {"interface": {"name": modem_id}}})
+                commands.append({"show": {"interface": {"stat": {"name": modem_id}}}})
+            data = await request_fn("post", "/rci/", json_data=commands)
+            if not isinstance(data, list):
+                raise ValueError("No modem information received")
+
+            for index, (modem_id, modem_type) in enumerate(modems.items()):
+                master_data = (data[2 * index] or {}).get("show", {}).get("interface", {}) or {}
+                stats = (
+                    (data[2 * index + 1] or {}).get("show", {}).get("interface", {}).get("stat", {})
+                    or {}
+                )
+
+                if master_data.get("interface-name", "") == "":
+                    continue
+
+                modem_data[modem_id] = {
+                    "id": modem_id,
+                    "type": master_data.get("type", modem_type),
+                    "uplink": True,
+                    "interface-name": master_data.get("interface-name", ""),
+                    "mac": master_data.get("mac", ""),
+                    "mobile": master_data.get("mobile", ""),
+                    "operator": master_data.get("operator", ""),
+                    "connected": master_data.get("connected", ""),
+                    "connection-state": master_data.get("connection-state", ""),
+                    "state": master_data.get("state", ""),
+                    "description": MODEM_TYPES[modem_type] + master_data.get("description", ""),
+                    "sim": master_data.get("sim"),
+                    "up": master_data.get("connected") == "yes",
+                    "link": master_data.get("link"),
+                    "temperature": master_data.get("temperature"),
+                    "signal": ModemProcessor._get_signal(master_data),
+                    "attributes": {
+                        "rx_speed": stats.get("rxspeed", 0),
+                        "tx_speed": stats.get("txspeed", 0),
+                        "rx_bytes": stats.get("rxbytes", 0),
+                        "tx_bytes": stats.get("txbytes", 0),
+                    },
+                }
+
+            _LOGGER.debug("Processed modem interfaces: %s", list(modem_data))
+            return modem_data
+
+        except Exception as ex:
+            _LOGGER.debug("Error processing modem interfaces: %s", str(ex))
+            raise
@@ -0,0 +1,99 @@
+"""Connectivity check processor for Keenetic integration."""
+import logging
+from typing import Dict, Any, Optional
+
+from .stats import RunningStats, QuantileSketch
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _UplinkStats:
+    """Streaming latency, jitter and loss statistics of one uplink."""
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.latency = RunningStats()
+        self.jitter = RunningStats()
+        self.p50 = QuantileSketch(0.5)
+        self.p95 = QuantileSketch(0.95)
+        self.last_rtt: Optional[float] = None
+        self.successes: Optional[int] = None
+        self.failures: Optional[int] = None
+        self.probes = 0
+        self.lost = 0
+
+    def add_rtt(self, rtt: float) -> None:
+        """Add a round trip time sample."""
+        self.latency.add(rtt)
+        self.p50.add(rtt)
+        self.p95.add(rtt)
+        if self.last_rtt is not None:
+            self.jitter.add(abs(rtt - self.last_rtt))
+        self.last_rtt = rtt
+
+    def add_counts(self, successes: int, failures: int) -> int:
+        """Count the probes since the previous poll, return the new successes.
+
+        The router resets its counters, a decrease starts counting again.
+        """
+        if self.successes is not None and successes >= self.successes and failures >= self.failures:
+            new_successes = successes - self.successes
+            new_failures = failures - self.failures
+        else:
+            new_successes, new_failures = successes, failures
+        self.successes, self.failures = successes, failures
+        self.probes += new_successes + new_failures
+        self.lost += new_failures
+        return new_successes
+
+
+class PingCheckProcessor:
+    """Keep per-uplink statistics of the router ping-check results.
+
+    Mean and variance are computed online and p50/p95 latency are estimated
+    with constant-memory sketches, so the statistics cover every check since
+    startup without storing samples.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the processor."""
+        self._uplinks: Dict[str, _UplinkStats] = {}
+
+    @staticmethod
+    def _round(value: Optional[float]) -> Optional[float]:
+        """Round a statistic for publishing."""
+        return round(value, 1) if value is not None else None
+
+    def process_ping_check(self, ping_check_info: dict) -> Dict[str, Any]:
+        """Update the statistics and return them per uplink interface."""
+        result = {}
+        for profile in ping_check_info.get("pingcheck", []):
+            for interface_id, check in (profile.get("interface") or {}).items():
+                uplink = self._uplinks.setdefault(interface_id, _UplinkStats())
+                try:
+                    new_successes = uplink.add_counts(
+                        int(check.get("successcount", 0)), int(check.get("failcount", 0))
+                    )
+                    # The router keeps reporting the last rtt between checks,
+                    # it is only a new sample when a check succeeded since
+                    rtt = check.get("rtt")
+                    if rtt is not None and new_successes > 0:
+                        uplink.add_rtt(float(rtt))
+                except (TypeError, ValueError):
+                    continue
+
+                result[interface_id] = {
+                    "profile": profile.get("profile", ""),
+                    "status": check.get("status", ""),
+                    "latency": self._round(uplink.last_rtt),
+                    "latency_mean": self._round(uplink.latency.mean if uplink.latency.count else None),
+                    "latency_stdev": self._round(uplink.latency.stdev if uplink.latency.count else None),
+                    "latency_p50": self._round(uplink.p50.value),
+                    "latency_p95": self._round(uplink.p95.value),
+                    "jitter": self._round(uplink.jitter.mean if uplink.jitter.count else None),
+                    "loss": round(uplink.lost / uplink.probes * 100, 2) if uplink.probes else None,
+                    "samples": uplink.latency.count,
+                }
+
+        _LOGGER.debug("Processed ping-check for %d uplinks", len(result))
+        return result
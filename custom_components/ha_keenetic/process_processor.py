@@ -0,0 +1,86 @@
+"""Router process processor for Keenetic integration."""
+import heapq
+import logging
+import time
+from typing import Dict, Any, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ProcessProcessor:
+    """Find the router processes that use the most CPU.
+
+    The process list is large and rarely interesting, so it is sampled at
+    most once per ``interval`` seconds and only while the total CPU load is
+    at least ``cpu_threshold`` percent. The CPU share of every process is
+    compared with the previous sample, and the ``top_count`` busiest
+    processes are selected with a bounded heap.
+    """
+
+    def __init__(self, top_count: int, interval: float, cpu_threshold: float) -> None:
+        """Initialize the processor."""
+        self._top_count = top_count
+        self._interval = interval
+        self._cpu_threshold = cpu_threshold
+        self._sampled: Optional[float] = None
+        self._cpu: Dict[str, float] = {}
+        self._result: Dict[str, Any] = {"active": False, "process_count": 0, "top_processes": []}
+
+    @property
+    def result(self) -> Dict[str, Any]:
+        """Return the result of the last sample."""
+        return self._result
+
+    def is_due(self, cpu_usage: Optional[float]) -> bool:
+        """Return True if the process list should be sampled now."""
+        if cpu_usage is None or cpu_usage < self._cpu_threshold:
+            if self._result["active"]:
+                _LOGGER.debug("CPU load %s%% is low, pausing process sampling", cpu_usage)
+                self._result = {**self._result, "active": False}
+            return False
+        return self._sampled is None or time.monotonic() - self._sampled >= self._interval
+
+    @staticmethod
+    def _get_cpu(process: dict) -> Optional[float]:
+        """Return the CPU share of a process in percent."""
+        cpu = process.get("statistics", {}).get("cpu", {})
+        value = next((cpu[key] for key in ("now", "cur", "avg") if key in cpu), None)
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
+    def process_processes(self, process_info: dict) -> Dict[str, Any]:
+        """Process the process list and return the top CPU consumers."""
+        self._sampled = time.monotonic()
+        processes = (
+            process_info.get("process", []) if isinstance(process_info, dict) else process_info or []
+        )
+
+        samples = []
+        cpu_by_pid = {}
+        for process in processes:
+            cpu = self._get_cpu(process)
+            pid = str(process.get("pid", ""))
+            if cpu is None or not pid:
+                continue
+            name = process.get("name") or process.get("comm") or process.get("arg0") or pid
+            last = self._cpu.get(pid)
+            cpu_by_pid[pid] = cpu
+            samples.append({
+                "name": name,
+                "pid": pid,
+                "cpu": round(cpu, 1),
+                "delta": round(cpu - last, 1) if last is not None else None,
+            })
+
+        # Processes that exited are forgotten with their previous share
+        self._cpu = cpu_by_pid
+
+        self._result = {
+            "active": True,
+            "process_count": len(samples),
+            "top_processes": heapq.nlargest(self._top_count, samples, key=lambda p: p["cpu"]),
+        }
+        _LOGGER.debug("Sampled %d processes", len(samples))
+        return self._result
@@ -0,0 +1,98 @@
+"""Cached read-only RCI queries for Keenetic integration."""
+from __future__ import annotations
+import asyncio
+from collections import OrderedDict
+from functools import partial
+import logging
+import time
+from typing import Any, Awaitable, Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RciCache:
+    """Answer RCI show queries from a TTL cache.
+
+    Each query carries its own TTL, but a command reaches the router at most
+    once per ``min_interval`` seconds, and requests of different commands
+    are spaced at least ``spacing`` seconds apart. Identical queries that
+    arrive while one is in flight share its request instead of reaching the
+    router again. The request runs in its own task, so a cancelled caller
+    never leaves the others waiting. At most ``size`` responses and
+    ``results_size`` named results are kept, the least recently used go first.
+    """
+
+    def __init__(
+        self,
+        query_fn: Callable[[str], Awaitable[Any]],
+        size: int,
+        min_interval: float,
+        spacing: float,
+        results_size: int,
+    ) -> None:
+        """Initialize the cache."""
+        self._query_fn = query_fn
+        self._size = size
+        self._min_interval = min_interval
+        self._spacing = spacing
+        self._results_size = results_size
+        self._next_request = 0.0
+        self._responses: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Task] = {}
+        self._results: OrderedDict[str, Any] = OrderedDict()
+
+    @property
+    def results(self) -> dict[str, Any]:
+        """Return the named results of earlier queries."""
+        return dict(self._results)
+
+    async def async_query(self, path: str, ttl: float, name: str | None = None) -> Any:
+        """Return the response to a query, from the cache if it is fresh enough."""
+        cached = self._responses.get(path)
+        if cached is not None and time.monotonic() - cached[0] < max(ttl, self._min_interval):
+            self._responses.move_to_end(path)
+            response = cached[1]
+        else:
+            task = self._in_flight.get(path)
+            if task is None:
+                task = asyncio.create_task(self._async_request(path), name=f"rci query {path}")
+                self._in_flight[path] = task
+                task.add_done_callback(partial(self._query_done, path))
+            response = await asyncio.shield(task)
+
+        if name:
+            self._results[name] = response
+            self._results.move_to_end(name)
+            while len(self._results) > self._results_size:
+                self._results.popitem(last=False)
+        return response
+
+    async def _async_request(self, path: str) -> Any:
+        """Send a query to the router in the next free request slot."""
+        now = time.monotonic()
+        # Slots are taken in order when the request starts, so waiting
+        # requests keep their place without a lock
+        slot = max(now, self._next_request)
+        self._next_request = slot + self._spacing
+        if slot > now:
+            await asyncio.sleep(slot - now)
+        return await self._query_fn(path)
+
+    def _query_done(self, path: str, task: asyncio.Task) -> None:
+        """Store the response of a finished query and release its path."""
+        del self._in_flight[path]
+        if task.cancelled():
+            return
+        # Retrieving the exception also covers queries whose callers left
+        if task.exception() is not None:
+            _LOGGER.debug("RCI query %s failed: %s", path, task.exception())
+            return
+        self._store(path, task.result())
+
+    def _store(self, path: str, response: Any) -> None:
+        """Cache a response, evicting the least recently used one if full."""
+        self._responses[path] = (time.monotonic(), response)
+        self._responses.move_to_end(path)
+        while len(self._responses) > self._size:
+            evicted, _ = self._responses.popitem(last=False)
+            _LOGGER.debug("Evicted cached RCI response for %s", evicted)
@@ -0,0 +1,158 @@
+"""Array-backed history of Keenetic metrics."""
+from __future__ import annotations
+import logging
+import time
+from typing import Dict, Any, Set
+import warnings
+
+import numpy as np
+
+_LOGGER = logging.getLogger(__name__)
+
+INTERFACE_METRICS = ("rx_bytes", "tx_bytes", "rx_speed", "tx_speed")
+SYSTEM_METRICS = ("cpu_usage", "ram_usage")
+
+RX_BYTES, TX_BYTES, RX_SPEED, TX_SPEED = range(len(INTERFACE_METRICS))
+
+
+class MetricRingBuffer:
+    """Keep the last samples of every interface and of the system load.
+
+    All interfaces share one preallocated array of ``max_interfaces`` rows by
+    ``capacity`` samples, so the memory of a router is fixed. Rates, averages
+    and percentiles are computed for all interfaces at once with NumPy.
+    The row of an interface is released once it has no sample left in the
+    window, or earlier when a new interface needs a row, in which case the
+    interface seen least recently gives up its row. Only interfaces beyond
+    ``max_interfaces`` present at the same time are not recorded.
+    """
+
+    def __init__(self, capacity: int, max_interfaces: int) -> None:
+        """Initialize the buffer."""
+        self._capacity = capacity
+        self._max_interfaces = max_interfaces
+        self._timestamps = np.full(capacity, np.nan)
+        self._interfaces = np.full(
+            (max_interfaces, capacity, len(INTERFACE_METRICS)), np.nan
+        )
+        self._system = np.full((capacity, len(SYSTEM_METRICS)), np.nan)
+        self._rows: Dict[str, int] = {}
+        self._free_rows = list(reversed(range(max_interfaces)))
+        self._last_seen: Dict[str, int] = {}
+        self._samples = 0
+        self._position = 0
+        self._count = 0
+
+    def _release_row(self, interface_id: str) -> None:
+        """Give the row of an interface back, clearing its samples."""
+        row = self._rows.pop(interface_id)
+        del self._last_seen[interface_id]
+        self._interfaces[row] = np.nan
+        self._free_rows.append(row)
+
+    def _get_row(self, interface_id: str, present: Set[str]) -> int | None:
+        """Return the row of an interface, allocating one for a new interface."""
+        row = self._rows.get(interface_id)
+        if row is not None:
+            return row
+        if not self._free_rows:
+            absent = [known_id for known_id in self._last_seen if known_id not in present]
+            if not absent:
+                return None
+            self._release_row(min(absent, key=self._last_seen.__getitem__))
+        row = self._rows[interface_id] = self._free_rows.pop()
+        return row
+
+    def add(self, interfaces: Dict[str, Any], system: Dict[str, Any]) -> None:
+        """Record one sample of every interface and of the system load."""
+        position = self._position
+        self._timestamps[position] = time.monotonic()
+        self._interfaces[:, position, :] = np.nan
+        self._system[position, :] = [
+            float(system.get(metric, np.nan)) for metric in SYSTEM_METRICS
+        ]
+
+        present = {
+            interface_id for interface_id, interface_data in interfaces.items()
+            if "rx_bytes" in interface_data.get("attributes", {})
+        }
+        for interface_id, interface_data in interfaces.items():
+            if interface_id not in present:
+                continue
+            attributes = interface_data["attributes"]
+            row = self._get_row(interface_id, present)
+            if row is None:
+                continue
+            self._last_seen[interface_id] = self._samples
+            try:
+                self._interfaces[row, position, :] = [
+                    float(attributes.get(metric, np.nan)) for metric in INTERFACE_METRICS
+                ]
+            except (TypeError, ValueError):
+                continue
+
+        # Interfaces without any sample left in the window are forgotten
+        for interface_id, seen in list(self._last_seen.items()):
+            if self._samples - seen >= self._capacity:
+                self._release_row(interface_id)
+
+        self._samples += 1
+        self._position = (position + 1) % self._capacity
+        self._count = min(self._count + 1, self._capacity)
+
+    def _ordered(self) -> np.ndarray:
+        """Return the indices of the recorded samples, oldest first."""
+        start = (self._position - self._count) % self._capacity
+        return (start + np.arange(self._count)) % self._capacity
+
+    @staticmethod
+    def _round(values: np.ndarray) -> list:
+        """Return rounded values, NaN as None."""
+        return [None if np.isnan(value) else round(float(value), 2) for value in values]
+
+    def summary(self) -> Dict[str, Any]:
+        """Return rates, averages and p95 of the buffered window."""
+        if self._count < 2 or not self._rows:
+            return {}
+
+        order = self._ordered()
+        timestamps = self._timestamps[order]
+        interface_ids = list(self._rows)
+        interfaces = self._interfaces[[self._rows[i] for i in interface_ids]][:, order, :]
+        system = self._system[order]
+
+        with warnings.catch_warnings():
+            # Rows without any sample in the window yield NaN
+            warnings.simplefilter("ignore", RuntimeWarning)
+
+            # Counter deltas over time, counter resets are dropped
+            deltas = np.diff(interfaces[:, :, [RX_BYTES, TX_BYTES]], axis=1)
+            deltas[deltas < 0] = np.nan
+            rates = np.nanmean(deltas / np.diff(timestamps)[None, :, None], axis=1)
+
+            speeds = interfaces[:, :, [RX_SPEED, TX_SPEED]]
+            speed_means = np.nanmean(speeds, axis=1)
+            speed_p95 = np.nanpercentile(speeds, 95, axis=1)
+
+            system_means = np.nanmean(system, axis=0)
+            system_p95 = np.nanpercentile(system, 95, axis=0)
+
+        rx_rate, tx_rate = self._round(rates[:, 0]), self._round(rates[:, 1])
+        rx_mean, tx_mean = self._round(speed_means[:, 0]), self._round(speed_means[:, 1])
+        rx_p95, tx_p95 = self._round(speed_p95[:, 0]), self._round(speed_p95[:, 1])
+
+        result: Dict[str, Any] = {
+            "samples": self._count,
+            "window": round(float(timestamps[-1] - timestamps[0])),
+            "interface": {
+                interface_id: {
+                    "rx_speed": {"rate": rx_rate[index], "mean": rx_mean[index], "p95": rx_p95[index]},
+                    "tx_speed": {"rate": tx_rate[index], "mean": tx_mean[index], "p95": tx_p95[index]},
+                }
+                for index, interface_id in enumerate(interface_ids)
+            },
+        }
+        for index, metric in enumerate(SYSTEM_METRICS):
+            mean, p95 = self._round(np.array([system_means[index], system_p95[index]]))
+            result[metric] = {"mean": mean, "p95": p95}
+        return result
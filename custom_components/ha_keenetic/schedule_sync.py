@@ -0,0 +1,129 @@
+"""Router-side WiFi schedules for Keenetic integration."""
+import logging
+import re
+from typing import Dict, Any, List, Set, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+DAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+# An action is (type, hour, minute, days), days as a comma separated list
+Action = Tuple[str, int, int, str]
+
+
+class ScheduleSync:
+    """Diff desired WiFi schedules against the router configuration.
+
+    A schedule is owned by one access point and named after it. Only the
+    actions that differ and a changed interface binding are written, so an
+    unchanged schedule costs two reads and no writes. An empty schedule is
+    unbound and deleted from the router.
+    """
+
+    @staticmethod
+    def get_schedule_name(ap_id: str) -> str:
+        """Return the name of the schedule owned by an access point."""
+        return "ha_" + re.sub(r"\W", "_", ap_id)
+
+    @staticmethod
+    def _format_days(days: List[str]) -> str:
+        """Return days in week order as the router lists them."""
+        days = {day.lower()[:3] for day in days} or set(DAYS)
+        return ",".join(day for day in DAYS if day in days)
+
+    @staticmethod
+    def _parse_time(value: str) -> Tuple[int, int]:
+        """Return hour and minute of an HH:MM time."""
+        hour, minute = value.split(":")[:2]
+        return int(hour), int(minute)
+
+    @staticmethod
+    def _next_days(days: str) -> str:
+        """Return the days following each of the days, sun wrapping to mon."""
+        return ScheduleSync._format_days([
+            DAYS[(DAYS.index(day) + 1) % len(DAYS)] for day in days.split(",")
+        ])
+
+    @staticmethod
+    def build_actions(periods: List[Dict[str, Any]]) -> Set[Action]:
+        """Return the actions that switch the access point on and off per period."""
+        actions = set()
+        for period in periods:
+            days = ScheduleSync._format_days(period.get("days", []))
+            start = ScheduleSync._parse_time(period["start"])
+            end = ScheduleSync._parse_time(period["end"])
+            actions.add(("start", *start, days))
+            # A period ending at or before its start crosses midnight
+            stop_days = days if end > start else ScheduleSync._next_days(days)
+            actions.add(("stop", *end, stop_days))
+        return actions
+
+    @staticmethod
+    def parse_actions(schedule_config: Dict[str, Any]) -> Set[Action]:
+        """Return the actions of a schedule read from the router."""
+        actions = schedule_config.get("action", []) if schedule_config else []
+        if isinstance(actions, dict):
+            actions = [actions]
+        return {
+            (
+                action.get("type", ""),
+                int(action.get("hour", 0)),
+                int(action.get("min", 0)),
+                ScheduleSync._format_days(str(action.get("dow", "")).split(",")),
+            )
+            for action in actions
+        }
+
+    @staticmethod
+    def _action_key(name: str, action: Action) -> str:
+        """Return the write queue key of a schedule action."""
+        return "/".join((name, *map(str, action)))
+
+    @staticmethod
+    def _action_command(name: str, action: Action, remove: bool) -> Dict[str, Any]:
+        """Return the RCI command adding or removing a schedule action."""
+        action_type, hour, minute, days = action
+        command = {"type": action_type, "hour": hour, "min": minute, "dow": days}
+        if remove:
+            command["no"] = True
+        return {"schedule": {"name": name, "action": command}}
+
+    @staticmethod
+    def diff(
+        ap_id: str,
+        desired: Set[Action],
+        existing: Set[Action],
+        bound_schedule: str,
+        exists: bool,
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """Return the keyed writes that turn the existing schedule into the desired one."""
+        name = ScheduleSync.get_schedule_name(ap_id)
+        writes = []
+
+        if not desired:
+            # Unbind first so the interface never refers to a missing schedule
+            if bound_schedule == name:
+                writes.append((
+                    f"{ap_id}/schedule",
+                    {"interface": {"name": ap_id, "schedule": {"no": True}}},
+                ))
+            if exists:
+                writes.append((name, {"schedule": {"name": name, "no": True}}))
+            _LOGGER.debug("Schedule %s needs %d writes to be removed", name, len(writes))
+            return writes
+
+        changes = [(action, True) for action in sorted(existing - desired)]
+        changes += [(action, False) for action in sorted(desired - existing)]
+        for action, remove in changes:
+            writes.append((
+                ScheduleSync._action_key(name, action),
+                ScheduleSync._action_command(name, action, remove),
+            ))
+
+        if bound_schedule != name:
+            writes.append((
+                f"{ap_id}/schedule", {"interface": {"name": ap_id, "schedule": name}}
+            ))
+
+        _LOGGER.debug("Schedule %s needs %d writes", name, len(writes))
+        return writes
@@ -12,8 +12,9 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import (
@@ -22,14 +23,27 @@ from homeassistant.helpers.update_coordinator import (
 )
 from homeassistant.const import (
     PERCENTAGE,
+    SIGNAL_STRENGTH_DECIBELS,
     UnitOfTime,
     UnitOfTemperature,
     UnitOfInformation,
     UnitOfDataRate,
+    SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
 )
 
-from .const import DOMAIN, MANUFACTURER
+from .const import (
+    DOMAIN,
+    MANUFACTURER,
+    CONF_COUNTER_SENSORS,
+    DEFAULT_COUNTER_SENSORS,
+    TOP_TALKERS_COUNT,
+    TOP_PROCESSES_COUNT,
+    SIGNAL_BURST_SAMPLE,
+    SIGNAL_RCI_RESULT,
+)
 from .icons import *
+from .deadband import Deadband, DeadbandFilter, build_deadbands
+from .consumers import DatasetConsumer, get_interface_dataset
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,6 +53,7 @@ class KeeneticSensorEntityDescription(SensorEntityDescription):
     value_fn: callable = lambda x: x
     available_fn: callable = lambda x: True
     use_full_data: bool = False
+    datasets: tuple = ("system",)
 
 @dataclass
 class InterfaceSensorEntityDescription(SensorEntityDescription):
@@ -46,6 +61,7 @@ class InterfaceSensorEntityDescription(SensorEntityDescription):
     interface_id: str = None
     value_fn: callable = lambda x: x
     available_fn: callable = lambda x: True
+    exists_fn: callable = lambda x: True
     extra_attributes_fn: callable = lambda x: {}
 
 @dataclass
@@ -154,31 +170,33 @@ SENSOR_TYPES: tuple[KeeneticSensorEntityDescription, ...] = (
         icon="mdi:access-point-network",
         entity_category=EntityCategory.DIAGNOSTIC,
         value_fn=lambda x: len(x.get("mesh", {})),
+        use_full_data=True,
+        datasets=("mesh",),
+    ),
+    KeeneticSensorEntityDescription(
+        key="stale_datasets",
+        name="Stale Datasets",
+        icon=ICON_WARNING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda x: sum(
+            1 for status in x.get("datasets", {}).values() if status["stale"]
+        ),
         use_full_data=True
     ),
 )
 
 INTERFACE_SENSORS: list[InterfaceSensorEntityDescription] = [
-    InterfaceSensorEntityDescription(
-        key="link",
-        name="Link Status",
-        icon=ICON_ETHERNET_ON,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda x: "up" if x.get("link") == "up" else "down",
-        extra_attributes_fn=lambda x: {
-            "rx_bytes": x.get("rxbytes", 0),
-            "tx_bytes": x.get("txbytes", 0),
-        },
-    ),
     InterfaceSensorEntityDescription(
         key="speed",
         name="Speed",
         icon=ICON_SPEED,
         native_unit_of_measurement=UnitOfDataRate.MEGABITS_PER_SECOND,
+        device_class=SensorDeviceClass.DATA_RATE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda x: x.get("speed", 0),
+        value_fn=lambda x: int(x.get("attributes", {}).get("speed") or 0),
         available_fn=lambda x: x.get("link") == "up",
+        exists_fn=lambda x: "speed" in x.get("attributes", {}),
     ),
     InterfaceSensorEntityDescription(
         key="rx_speed",
@@ -187,7 +205,8 @@ INTERFACE_SENSORS: list[InterfaceSensorEntityDescription] = [
         native_unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.DATA_RATE,
-        value_fn=lambda x: x.get("rxspeed", 0),
+        value_fn=lambda x: x.get("attributes", {}).get("rx_speed", 0),
+        exists_fn=lambda x: "rx_speed" in x.get("attributes", {}),
     ),
     InterfaceSensorEntityDescription(
         key="tx_speed",
@@ -196,10 +215,294 @@ INTERFACE_SENSORS: list[InterfaceSensorEntityDescription] = [
         native_unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.DATA_RATE,
-        value_fn=lambda x: x.get("txspeed", 0),
+        value_fn=lambda x: x.get("attributes", {}).get("tx_speed", 0),
+        exists_fn=lambda x: "tx_speed" in x.get("attributes", {}),
+    ),
+]
+
+# Raw counters, created only when they are moved off the interface attributes
+COUNTER_ATTRIBUTES = ("rx_bytes", "tx_bytes")
+
+# Attributes of the sampling window statistics, new with every window
+AGGREGATE_ATTRIBUTES = frozenset({"mean", "min", "max", "p95", "samples"})
+
+COUNTER_SENSORS: list[InterfaceSensorEntityDescription] = [
+    InterfaceSensorEntityDescription(
+        key="rx_bytes",
+        name="Received Bytes",
+        icon=ICON_DOWNLOAD,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        suggested_unit_of_measurement=UnitOfInformation.GIGABYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda x: x.get("attributes", {}).get("rx_bytes", 0),
+        exists_fn=lambda x: "rx_bytes" in x.get("attributes", {}),
+    ),
+    InterfaceSensorEntityDescription(
+        key="tx_bytes",
+        name="Sent Bytes",
+        icon=ICON_UPLOAD,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        suggested_unit_of_measurement=UnitOfInformation.GIGABYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda x: x.get("attributes", {}).get("tx_bytes", 0),
+        exists_fn=lambda x: "tx_bytes" in x.get("attributes", {}),
+    ),
+]
+
+TRAFFIC_SENSORS: list[InterfaceSensorEntityDescription] = [
+    InterfaceSensorEntityDescription(
+        key="daily_rx",
+        name="Received Today",
+        icon=ICON_DOWNLOAD,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        suggested_unit_of_measurement=UnitOfInformation.MEGABYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda x: x.get("daily_rx", 0),
+    ),
+    InterfaceSensorEntityDescription(
+        key="daily_tx",
+        name="Sent Today",
+        icon=ICON_UPLOAD,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        suggested_unit_of_measurement=UnitOfInformation.MEGABYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda x: x.get("daily_tx", 0),
+    ),
+    InterfaceSensorEntityDescription(
+        key="monthly_rx",
+        name="Received This Month",
+        icon=ICON_DATA_USAGE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        suggested_unit_of_measurement=UnitOfInformation.GIGABYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda x: x.get("monthly_rx", 0),
+    ),
+    InterfaceSensorEntityDescription(
+        key="monthly_tx",
+        name="Sent This Month",
+        icon=ICON_DATA_USAGE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        suggested_unit_of_measurement=UnitOfInformation.GIGABYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda x: x.get("monthly_tx", 0),
     ),
 ]
 
+# Radio metrics of LTE and USB modems
+MODEM_SENSORS: list[InterfaceSensorEntityDescription] = [
+    InterfaceSensorEntityDescription(
+        key="rssi",
+        name="RSSI",
+        native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda x: x["signal"].get("rssi"),
+        exists_fn=lambda x: "rssi" in x.get("signal", {}),
+    ),
+    InterfaceSensorEntityDescription(
+        key="rsrp",
+        name="RSRP",
+        native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda x: x["signal"].get("rsrp"),
+        exists_fn=lambda x: "rsrp" in x.get("signal", {}),
+    ),
+    InterfaceSensorEntityDescription(
+        key="rsrq",
+        name="RSRQ",
+        native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS,
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda x: x["signal"].get("rsrq"),
+        exists_fn=lambda x: "rsrq" in x.get("signal", {}),
+    ),
+    InterfaceSensorEntityDescription(
+        key="sinr",
+        name="SINR",
+        native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS,
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda x: x["signal"].get("sinr"),
+        exists_fn=lambda x: "sinr" in x.get("signal", {}),
+    ),
+    InterfaceSensorEntityDescription(
+        key="band",
+        name="Band",
+        icon=ICON_MOBILE,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda x: x["signal"].get("band"),
+        exists_fn=lambda x: "band" in x.get("signal", {}),
+    ),
+    InterfaceSensorEntityDescription(
+        key="cell_id",
+        name="Cell ID",
+        icon=ICON_MOBILE,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda x: x["signal"].get("cell_id"),
+        exists_fn=lambda x: "cell_id" in x.get("signal", {}),
+    ),
+    InterfaceSensorEntityDescription(
+        key="temperature",
+        name="Temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda x: x["signal"].get("temperature"),
+        exists_fn=lambda x: "temperature" in x.get("signal", {}),
+    ),
+]
+
+# Peers of WireGuard tunnels
+TUNNEL_SENSORS: list[InterfaceSensorEntityDescription] = [
+    InterfaceSensorEntityDescription(
+        key="handshake_age",
+        name="Last Handshake",
+        icon=ICON_HANDSHAKE,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda x: x["peers"]["handshake_age"],
+        available_fn=lambda x: bool(x.get("peers")) and x["peers"]["handshake_age"] is not None,
+        exists_fn=lambda x: x.get("peers") is not None,
+    ),
+    InterfaceSensorEntityDescription(
+        key="peers_online",
+        name="Peers Online",
+        icon=ICON_VPN,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda x: x["peers"]["peers_online"],
+        available_fn=lambda x: bool(x.get("peers")),
+        exists_fn=lambda x: x.get("peers") is not None,
+    ),
+]
+
+# Uplink quality from the router ping-check, created for WAN and modem interfaces
+LATENCY_SENSORS: list[InterfaceSensorEntityDescription] = [
+    InterfaceSensorEntityDescription(
+        key="latency_p50",
+        name="Latency",
+        icon=ICON_LATENCY,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda x: x.get("latency_p50"),
+        extra_attributes_fn=lambda x: {
+            "last": x.get("latency"),
+            "mean": x.get("latency_mean"),
+            "stdev": x.get("latency_stdev"),
+            "samples": x.get("samples"),
+            "status": x.get("status"),
+        },
+    ),
+    InterfaceSensorEntityDescription(
+        key="latency_p95",
+        name="Latency p95",
+        icon=ICON_LATENCY,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda x: x.get("latency_p95"),
+    ),
+    InterfaceSensorEntityDescription(
+        key="jitter",
+        name="Jitter",
+        icon=ICON_LATENCY,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda x: x.get("jitter"),
+    ),
+    InterfaceSensorEntityDescription(
+        key="packet_loss",
+        name="Packet Loss",
+        icon=ICON_PACKET_LOSS,
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda x: x.get("loss"),
+    ),
+]
+
+# Load of mesh extenders, polled on their own schedule
+MESH_NODE_SENSORS: list[MeshNodeSensorEntityDescription] = [
+    MeshNodeSensorEntityDescription(
+        key="cpu_usage",
+        name="CPU Usage",
+        icon=ICON_CPU,
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda x: x.get("cpu_usage"),
+    ),
+    MeshNodeSensorEntityDescription(
+        key="ram_usage",
+        name="RAM Usage",
+        icon=ICON_MEMORY,
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda x: x.get("ram_usage"),
+    ),
+]
+
+# Per access point client statistics from the association table
+ASSOCIATION_SENSORS: list[InterfaceSensorEntityDescription] = [
+    InterfaceSensorEntityDescription(
+        key="clients",
+        name="Clients",
+        icon=ICON_WIFI_CLIENTS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda x: x.get("clients", 0),
+    ),
+    InterfaceSensorEntityDescription(
+        key="weak_clients",
+        name="Weak Signal Clients",
+        icon=ICON_WIFI_WEAK,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda x: x.get("weak_clients", 0),
+    ),
+    InterfaceSensorEntityDescription(
+        key="rssi_avg",
+        name="Average RSSI",
+        native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda x: x.get("rssi_avg"),
+    ),
+    InterfaceSensorEntityDescription(
+        key="rssi_min",
+        name="Minimum RSSI",
+        native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        value_fn=lambda x: x.get("rssi_min"),
+    ),
+    InterfaceSensorEntityDescription(
+        key="rssi_max",
+        name="Maximum RSSI",
+        native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        value_fn=lambda x: x.get("rssi_max"),
+    ),
+]
+
+def _get_interface_label(interface_id: str, interface_data: dict) -> str:
+    """Return a human readable name of an interface."""
+    if interface_data.get("type") == "AccessPoint":
+        band = "5GHz" if "WifiMaster1" in interface_id else "2.4GHz"
+        return f"{interface_data.get('ssid', interface_id)} ({band})"
+    return interface_data.get("label") or interface_data.get("description") or interface_id
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -207,28 +510,99 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Keenetic sensors."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+    counter_sensors = config_entry.options.get(
+        CONF_COUNTER_SENSORS, DEFAULT_COUNTER_SENSORS
+    )
+    deadbands = build_deadbands(config_entry.options)
     
     entities = []
     
     for description in SENSOR_TYPES:
-        entities.append(KeeneticSensor(coordinator, description, config_entry))
+        entities.append(
+            KeeneticSensor(
+                coordinator, description, config_entry, deadbands.get(description.key)
+            )
+        )
     
     if coordinator.data and "interface" in coordinator.data:
         _LOGGER.debug("Found interfaces: %s", coordinator.data["interface"].keys())
         for interface_id, interface_data in coordinator.data["interface"].items():
-            if interface_data.get("type") in ["wan", "port"]:
+            if interface_data.get("type") in ["wan", "port", "tunnel"]:
                 entities.append(
                     KeeneticInterfaceSensor(
                         coordinator,
                         interface_id,
+                        config_entry,
+                        counter_sensors
+                    )
+                )
+            if interface_data.get("uplink"):
+                for description in LATENCY_SENSORS:
+                    entities.append(
+                        KeeneticLatencySensor(
+                            coordinator,
+                            interface_id,
+                            description,
+                            config_entry
+                        )
+                    )
+            if interface_data.get("type") == "AccessPoint":
+                for description in ASSOCIATION_SENSORS:
+                    entities.append(
+                        KeeneticAccessPointSensor(
+                            coordinator,
+                            interface_id,
+                            description,
+                            config_entry
+                        )
+                    )
+            descriptions = (
+                INTERFACE_SENSORS
+                + MODEM_SENSORS
+                + TUNNEL_SENSORS
+                + (COUNTER_SENSORS if counter_sensors else [])
+            )
+            for description in descriptions:
+                if description.exists_fn(interface_data):
+                    entities.append(
+                        KeeneticInterfaceMetricSensor(
+                            coordinator,
+                            interface_id,
+                            description,
+                            config_entry,
+                            deadbands.get(description.key)
+                        )
+                    )
+
+    if coordinator.data and "traffic" in coordinator.data:
+        for interface_id in coordinator.data["traffic"]:
+            if interface_id not in coordinator.data["interface"]:
+                continue
+            for description in TRAFFIC_SENSORS:
+                entities.append(
+                    KeeneticTrafficSensor(
+                        coordinator,
+                        interface_id,
+                        description,
                         config_entry
                     )
                 )
 
+    for rank in range(TOP_TALKERS_COUNT):
+        entities.append(KeeneticTopTalkerSensor(coordinator, rank, config_entry))
+
+    entities.append(KeeneticTopProcessSensor(coordinator, config_entry))
+
+    entities.append(KeeneticBurstSampleSensor(config_entry))
+    entities.append(
+        KeeneticRciResultsSensor(
+            hass.data[DOMAIN][config_entry.entry_id]["rci_cache"], config_entry
+        )
+    )
+
     if coordinator.data and "mesh" in coordinator.data:
         _LOGGER.debug("Found mesh nodes: %s", coordinator.data["mesh"].keys())
         for node_id, node_data in coordinator.data["mesh"].items():
-            _LOGGER.debug("Adding mesh node: %s, data: %s", node_id, node_data)
             entities.append(
                 KeeneticMeshNodeSensor(
                     coordinator,
@@ -236,24 +610,38 @@ async def async_setup_entry(
                     config_entry
                 )
             )
+            for description in MESH_NODE_SENSORS:
+                entities.append(
+                    KeeneticMeshNodeResourceSensor(
+                        coordinator,
+                        node_id,
+                        description,
+                        config_entry
+                    )
+                )
     else:
         _LOGGER.debug("No mesh data found in coordinator data: %s", coordinator.data.keys())
     
     async_add_entities(entities)
 
-class KeeneticSensor(CoordinatorEntity, SensorEntity):
+class KeeneticSensor(DatasetConsumer, CoordinatorEntity, SensorEntity):
     """Representation of a Keenetic sensor."""
 
+    _unrecorded_attributes = frozenset({"history"}) | AGGREGATE_ATTRIBUTES
+
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
         description: KeeneticSensorEntityDescription,
         config_entry: ConfigEntry,
+        deadband: Deadband | None = None,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entity_description = description
         self._config_entry = config_entry
+        self._datasets = description.datasets
+        self._deadband_filter = DeadbandFilter(deadband) if deadband else None
         
         self._attr_unique_id = f"{config_entry.entry_id}_{description.key}"
         self._attr_has_entity_name = True
@@ -293,9 +681,44 @@ class KeeneticSensor(CoordinatorEntity, SensorEntity):
             and self.entity_description.available_fn(self.coordinator.data)
         )
 
-class KeeneticMeshNodeSensor(CoordinatorEntity, SensorEntity):
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return statistics of the last sampling window and of the history."""
+        if self.coordinator.data is None:
+            return None
+        attributes = dict(
+            self.coordinator.data.get("aggregates", {}).get(self.entity_description.key) or {}
+        )
+        history = self.coordinator.data.get("history", {}).get(self.entity_description.key)
+        if history:
+            attributes["history"] = history
+        return attributes or None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only when the value left its deadband."""
+        if self._deadband_filter is not None:
+            if not self.available:
+                self._deadband_filter.reset()
+            elif not self._deadband_filter.should_publish(
+                self.native_value, (self.extra_state_attributes or {}).get("max")
+            ):
+                return
+        super()._handle_coordinator_update()
+
+class KeeneticMeshNodeSensor(DatasetConsumer, CoordinatorEntity, SensorEntity):
     """Representation of a Keenetic Mesh Node sensor."""
 
+    _datasets = ("mesh",)
+    _unrecorded_attributes = frozenset({
+        "memory",
+        "uptime",
+        "hw_id",
+        "firmware_available",
+        "ports",
+        "access_points",
+    })
+
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
@@ -341,17 +764,12 @@ class KeeneticMeshNodeSensor(CoordinatorEntity, SensorEntity):
     def extra_state_attributes(self):
         """Return the state attributes."""
         if self.coordinator.data is None:
-            _LOGGER.debug("Coordinator data is None")
             return {}
             
         mesh_data = self.coordinator.data.get("mesh", {})
-        _LOGGER.debug("Mesh data from coordinator: %s", mesh_data)
-        
         node_data = mesh_data.get(self._node_id, {})
-        _LOGGER.debug("Node data for %s: %s", self._node_id, node_data)
-        
         attributes = node_data.get("attributes", {})
-        _LOGGER.debug("Node attributes: %s", attributes)
+        topology = node_data.get("topology") or {}
         
         result = {
             "ip_address": attributes.get("ip", ""),
@@ -363,26 +781,96 @@ class KeeneticMeshNodeSensor(CoordinatorEntity, SensorEntity):
             "uptime": attributes.get("uptime", ""),
             "cloud_state": attributes.get("cloud_agent_state", ""),
             "internet_available": attributes.get("internet_available", False),
+            "parent": topology.get("parent"),
+            "hops": topology.get("hops"),
+            "uplink": topology.get("uplink"),
+            "wireless_backhaul": topology.get("wireless"),
         }
+
+        resources = self.coordinator.data.get("mesh_resources", {}).get(self._node_id)
+        if resources:
+            result["ports"] = resources["ports"]
+            result["access_points"] = resources["access_points"]
         
-        _LOGGER.debug("Returning attributes: %s", result)
         return result
 
-class KeeneticInterfaceSensor(CoordinatorEntity, SensorEntity):
+class KeeneticMeshNodeResourceSensor(DatasetConsumer, CoordinatorEntity, SensorEntity):
+    """Representation of a load metric of a Keenetic mesh extender."""
+
+    _datasets = ("mesh", "mesh_resources")
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator,
+        node_id: str,
+        description: MeshNodeSensorEntityDescription,
+        config_entry: ConfigEntry,
+    ) -> None:
+        """Initialize the mesh node resource sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._node_id = node_id
+        self._config_entry = config_entry
+
+        node_data = self.coordinator.data["mesh"][node_id]
+        model = node_data.get("model", "")
+        known_host = node_data.get("known_host", "")
+        node_name = f"Mesh {model} ({known_host})" if known_host else f"Mesh {model or node_id}"
+        self._attr_name = f"{node_name} {description.name}"
+        self._attr_unique_id = f"{config_entry.entry_id}_mesh_node_{node_id}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, config_entry.entry_id)},
+        )
+
+    @property
+    def _resources(self) -> dict | None:
+        """Return the latest resources of the node."""
+        if self.coordinator.data is None:
+            return None
+        return self.coordinator.data.get("mesh_resources", {}).get(self._node_id)
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        resources = self._resources
+        if resources is None:
+            return None
+        return self.entity_description.value_fn(resources)
+
+    @property
+    def available(self) -> bool:
+        """Return True if entity is available."""
+        return super().available and self._resources is not None
+
+class KeeneticInterfaceSensor(DatasetConsumer, CoordinatorEntity, SensorEntity):
     """Representation of a Keenetic interface sensor."""
 
+    _unrecorded_attributes = frozenset({
+        "speed",
+        "rx_speed",
+        "tx_speed",
+        "rx_bytes",
+        "tx_bytes",
+        "interface_name",
+        "duplex",
+        "mac",
+    })
+
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
         interface_id: str,
         config_entry: ConfigEntry,
+        counter_sensors: bool = False,
     ) -> None:
         """Initialize the interface sensor."""
         super().__init__(coordinator)
         self._interface_id = interface_id
         self._config_entry = config_entry
+        self._counter_sensors = counter_sensors
         
         interface_data = self.coordinator.data["interface"][interface_id]
+        self._datasets = (get_interface_dataset(interface_id, interface_data),)
         self._attr_name = interface_data['label']
         self._attr_unique_id = f"{config_entry.entry_id}_interface_{interface_id}"
         self.entity_id = f"sensor.keenetic_interface_{interface_id}"
@@ -396,36 +884,486 @@ class KeeneticInterfaceSensor(CoordinatorEntity, SensorEntity):
             hw_version=coordinator.data.get("hardware_version", ""),
         )
 
+    @property
+    def _interface_data(self) -> dict | None:
+        """Return the current data of the interface."""
+        if self.coordinator.data is None:
+            return None
+        return self.coordinator.data.get("interface", {}).get(self._interface_id)
+
+    @property
+    def available(self) -> bool:
+        """Return True while the interface has a record, stale or not.
+
+        The record disappears once its dataset is older than the maximum age,
+        until then the last good value is kept and marked stale.
+        """
+        return super().available and self._interface_data is not None
+
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        if self.coordinator.data is None:
+        interface_data = self._interface_data
+        if interface_data is None:
             return None
-            
-        interface_data = self.coordinator.data["interface"][self._interface_id]
-        return interface_data["link"]
+        return interface_data.get("link")
 
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
-        if self.coordinator.data is None:
+        interface_data = self._interface_data
+        if interface_data is None:
             return {}
-            
-        interface_data = self.coordinator.data["interface"][self._interface_id]
         
-        return {
-            "interface_id": interface_data["id"],
+        attributes = {
+            "interface_id": interface_data.get("id", self._interface_id),
             "type": interface_data.get("type"),
             "description": interface_data.get("description"),
-            "speed": f"{interface_data.get('speed', 0)} Mbps",
-            "rx_speed": f"{interface_data.get('rxspeed', 0)} B/s",
-            "tx_speed": f"{interface_data.get('txspeed', 0)} B/s",
-            "rx_bytes": interface_data.get("rxbytes", 0),
-            "tx_bytes": interface_data.get("txbytes", 0),
+            "stale": self.coordinator.data.get("datasets", {}).get(
+                self._datasets[0], {}
+            ).get("stale", False),
             **interface_data.get("attributes", {})
         }
+        if self._counter_sensors:
+            for key in COUNTER_ATTRIBUTES:
+                attributes.pop(key, None)
+        return attributes
 
     @property
     def icon(self):
         """Return the icon of the sensor."""
-        return ICON_ETHERNET_ON if self.native_value == "up" else ICON_ETHERNET_OFF
\ No newline at end of file
+        if (self._interface_data or {}).get("type") == "tunnel":
+            return ICON_VPN if self.native_value == "up" else ICON_VPN_OFF
+        return ICON_ETHERNET_ON if self.native_value == "up" else ICON_ETHERNET_OFF
+
+class KeeneticInterfaceMetricSensor(DatasetConsumer, CoordinatorEntity, SensorEntity):
+    """Representation of a numeric Keenetic interface metric."""
+
+    _unrecorded_attributes = frozenset({"history"}) | AGGREGATE_ATTRIBUTES
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator,
+        interface_id: str,
+        description: InterfaceSensorEntityDescription,
+        config_entry: ConfigEntry,
+        deadband: Deadband | None = None,
+    ) -> None:
+        """Initialize the interface metric sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._interface_id = interface_id
+        self._config_entry = config_entry
+        self._deadband_filter = DeadbandFilter(deadband) if deadband else None
+
+        interface_data = self.coordinator.data["interface"][interface_id]
+        self._datasets = (get_interface_dataset(interface_id, interface_data),)
+        self._attr_name = f"{_get_interface_label(interface_id, interface_data)} {description.name}"
+        self._attr_unique_id = f"{config_entry.entry_id}_interface_{interface_id}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, config_entry.entry_id)},
+        )
+
+    @property
+    def _interface_data(self) -> dict | None:
+        """Return the current data of the interface."""
+        if self.coordinator.data is None:
+            return None
+        return self.coordinator.data.get("interface", {}).get(self._interface_id)
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        interface_data = self._interface_data
+        if interface_data is None:
+            return None
+        return self.entity_description.value_fn(interface_data)
+
+    @property
+    def available(self) -> bool:
+        """Return True if entity is available."""
+        interface_data = self._interface_data
+        return (
+            super().available
+            and interface_data is not None
+            and self.entity_description.available_fn(interface_data)
+        )
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return statistics of the last sampling window and of the history."""
+        if self.coordinator.data is None:
+            return None
+        attributes = dict(
+            self.coordinator.data.get("aggregates", {})
+            .get("interface", {})
+            .get(self._interface_id, {})
+            .get(self.entity_description.key)
+            or {}
+        )
+        history = (
+            self.coordinator.data.get("history", {})
+            .get("interface", {})
+            .get(self._interface_id, {})
+            .get(self.entity_description.key)
+        )
+        if history:
+            attributes["history"] = history
+        return attributes or None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only when the value left its deadband."""
+        if self._deadband_filter is not None:
+            if not self.available:
+                self._deadband_filter.reset()
+            elif not self._deadband_filter.should_publish(
+                self.native_value, (self.extra_state_attributes or {}).get("max")
+            ):
+                return
+        super()._handle_coordinator_update()
+
+
+class KeeneticTrafficSensor(DatasetConsumer, CoordinatorEntity, SensorEntity):
+    """Representation of accumulated traffic of a Keenetic interface."""
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator,
+        interface_id: str,
+        description: InterfaceSensorEntityDescription,
+        config_entry: ConfigEntry,
+    ) -> None:
+        """Initialize the traffic sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._interface_id = interface_id
+        self._config_entry = config_entry
+
+        interface_data = self.coordinator.data["interface"][interface_id]
+        self._datasets = (get_interface_dataset(interface_id, interface_data),)
+        self._attr_name = f"{_get_interface_label(interface_id, interface_data)} {description.name}"
+        self._attr_unique_id = f"{config_entry.entry_id}_traffic_{interface_id}_{description.key}"
+        # LAN ports and access points are numerous, only uplinks are enabled by default
+        self._attr_entity_registry_enabled_default = (
+            interface_data.get("type") not in ("port", "AccessPoint")
+        )
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, config_entry.entry_id)},
+        )
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        if self.coordinator.data is None:
+            return None
+
+        traffic = self.coordinator.data.get("traffic", {}).get(self._interface_id)
+        if traffic is None:
+            return None
+        return self.entity_description.value_fn(traffic)
+
+
+class KeeneticAccessPointSensor(DatasetConsumer, CoordinatorEntity, SensorEntity):
+    """Representation of client statistics of a Keenetic access point."""
+
+    _datasets = ("associations",)
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator,
+        interface_id: str,
+        description: InterfaceSensorEntityDescription,
+        config_entry: ConfigEntry,
+    ) -> None:
+        """Initialize the access point sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._interface_id = interface_id
+        self._config_entry = config_entry
+
+        interface_data = self.coordinator.data["interface"][interface_id]
+        self._attr_name = f"{_get_interface_label(interface_id, interface_data)} {description.name}"
+        self._attr_unique_id = f"{config_entry.entry_id}_ap_{interface_id}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, config_entry.entry_id)},
+        )
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        if self.coordinator.data is None:
+            return None
+
+        access_points = self.coordinator.data.get("associations", {}).get("access_points", {})
+        # Access points without associated stations are absent from the table
+        return self.entity_description.value_fn(access_points.get(self._interface_id, {}))
+
+    @property
+    def available(self) -> bool:
+        """Return True if entity is available."""
+        return (
+            super().available
+            and "access_points" in (self.coordinator.data or {}).get("associations", {})
+        )
+
+
+class KeeneticLatencySensor(DatasetConsumer, CoordinatorEntity, SensorEntity):
+    """Representation of the connectivity check statistics of an uplink."""
+
+    _datasets = ("latency",)
+    _unrecorded_attributes = frozenset({"last", "mean", "stdev", "samples"})
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator,
+        interface_id: str,
+        description: InterfaceSensorEntityDescription,
+        config_entry: ConfigEntry,
+    ) -> None:
+        """Initialize the latency sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._interface_id = interface_id
+        self._config_entry = config_entry
+
+        interface_data = self.coordinator.data["interface"][interface_id]
+        self._attr_name = f"{_get_interface_label(interface_id, interface_data)} {description.name}"
+        self._attr_unique_id = f"{config_entry.entry_id}_latency_{interface_id}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, config_entry.entry_id)},
+        )
+
+    @property
+    def _check(self) -> dict | None:
+        """Return the ping-check statistics of the uplink."""
+        if self.coordinator.data is None:
+            return None
+        return self.coordinator.data.get("latency", {}).get(self._interface_id)
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        check = self._check
+        if check is None:
+            return None
+        return self.entity_description.value_fn(check)
+
+    @property
+    def available(self) -> bool:
+        """Return True if the uplink is covered by a ping-check profile."""
+        return super().available and self._check is not None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the state attributes."""
+        check = self._check
+        if check is None:
+            return None
+        return self.entity_description.extra_attributes_fn(check) or None
+
+
+class KeeneticTopTalkerSensor(DatasetConsumer, CoordinatorEntity, SensorEntity):
+    """Representation of one of the busiest LAN hosts."""
+
+    _datasets = ("hosts",)
+    _attr_icon = ICON_TRAFFIC
+    _attr_native_unit_of_measurement = UnitOfDataRate.BYTES_PER_SECOND
+    _attr_device_class = SensorDeviceClass.DATA_RATE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _unrecorded_attributes = frozenset({"mac", "ip", "rx_rate", "tx_rate"})
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator,
+        rank: int,
+        config_entry: ConfigEntry,
+    ) -> None:
+        """Initialize the top talker sensor."""
+        super().__init__(coordinator)
+        self._rank = rank
+        self._config_entry = config_entry
+
+        self._attr_name = f"Top Talker {rank + 1}"
+        self._attr_unique_id = f"{config_entry.entry_id}_top_talker_{rank + 1}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, config_entry.entry_id)},
+        )
+
+    @property
+    def _host(self) -> dict | None:
+        """Return the host at this rank."""
+        if self.coordinator.data is None:
+            return None
+        top_talkers = self.coordinator.data.get("hosts", {}).get("top_talkers", [])
+        return top_talkers[self._rank] if self._rank < len(top_talkers) else None
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        host = self._host
+        return host["rate"] if host else 0
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the state attributes."""
+        host = self._host
+        if not host:
+            return {}
+        return {
+            "host": host["name"],
+            "mac": host["mac"],
+            "ip": host["ip"],
+            "rx_rate": host["rx_rate"],
+            "tx_rate": host["tx_rate"],
+        }
+
+
+class KeeneticTopProcessSensor(DatasetConsumer, CoordinatorEntity, SensorEntity):
+    """Representation of the router processes using the most CPU."""
+
+    _datasets = ("processes",)
+    _attr_icon = ICON_PROCESS
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    # The process list is only fetched while this sensor is enabled
+    _attr_entity_registry_enabled_default = False
+    _unrecorded_attributes = frozenset({"processes", "process_count"})
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator,
+        config_entry: ConfigEntry,
+    ) -> None:
+        """Initialize the top process sensor."""
+        super().__init__(coordinator)
+        self._config_entry = config_entry
+
+        self._attr_name = "Top Process"
+        self._attr_unique_id = f"{config_entry.entry_id}_top_process"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, config_entry.entry_id)},
+        )
+
+    @property
+    def _processes(self) -> dict:
+        """Return the last sample of the process list."""
+        if self.coordinator.data is None:
+            return {}
+        return self.coordinator.data.get("processes", {})
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the CPU share of the busiest process."""
+        top_processes = self._processes.get("top_processes", [])
+        return top_processes[0]["cpu"] if top_processes else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the busiest processes, at most TOP_PROCESSES_COUNT."""
+        processes = self._processes
+        top_processes = processes.get("top_processes", [])
+        if not top_processes:
+            return {}
+        return {
+            "process": top_processes[0]["name"],
+            "sampling": processes.get("active", False),
+            "process_count": processes.get("process_count", 0),
+            "processes": top_processes[:TOP_PROCESSES_COUNT],
+        }
+
+
+class KeeneticBurstSampleSensor(SensorEntity):
+    """Representation of the receive speed sampled by the burst_sample service."""
+
+    _attr_should_poll = False
+    _attr_icon = ICON_SPEED
+    _attr_native_unit_of_measurement = UnitOfDataRate.BYTES_PER_SECOND
+    _attr_device_class = SensorDeviceClass.DATA_RATE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _unrecorded_attributes = frozenset({"remaining"})
+
+    def __init__(self, config_entry: ConfigEntry) -> None:
+        """Initialize the burst sample sensor."""
+        self._config_entry = config_entry
+        self._sample: dict[str, Any] = {}
+
+        self._attr_name = "Burst Sample"
+        self._attr_unique_id = f"{config_entry.entry_id}_burst_sample"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, config_entry.entry_id)},
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to burst samples."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_BURST_SAMPLE.format(self._config_entry.entry_id),
+                self._async_handle_sample,
+            )
+        )
+
+    @callback
+    def _async_handle_sample(self, sample: dict[str, Any]) -> None:
+        """Publish a new sample."""
+        self._sample = sample
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        if not self._sample.get("active"):
+            return None
+        return self._sample.get("rx_speed")
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the state attributes."""
+        return {
+            "active": self._sample.get("active", False),
+            "interface": self._sample.get("interface"),
+            "tx_speed": self._sample.get("tx_speed"),
+            "remaining": self._sample.get("remaining"),
+        }
+
+
+class KeeneticRciResultsSensor(SensorEntity):
+    """Representation of the named results of the rci service."""
+
+    _attr_should_poll = False
+    _attr_icon = ICON_FEATURES
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _unrecorded_attributes = frozenset({"results"})
+
+    def __init__(self, rci_cache, config_entry: ConfigEntry) -> None:
+        """Initialize the RCI results sensor."""
+        self._rci_cache = rci_cache
+        self._config_entry = config_entry
+
+        self._attr_name = "RCI Results"
+        self._attr_unique_id = f"{config_entry.entry_id}_rci_results"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, config_entry.entry_id)},
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to new named results."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_RCI_RESULT.format(self._config_entry.entry_id),
+                self.async_write_ha_state,
+            )
+        )
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the number of named results."""
+        return len(self._rci_cache.results)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the named results."""
+        return {"results": self._rci_cache.results}
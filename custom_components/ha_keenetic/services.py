@@ -0,0 +1,162 @@
+"""Services of the Keenetic integration."""
+from __future__ import annotations
+import logging
+import re
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .api import KeeneticAuthError, KeeneticConnectionError
+from .const import (
+    DOMAIN,
+    SERVICE_BURST_SAMPLE,
+    DEFAULT_BURST_DURATION,
+    MAX_BURST_DURATION,
+    SERVICE_RCI,
+    DEFAULT_RCI_TTL,
+    SIGNAL_RCI_RESULT,
+    SERVICE_SET_WIFI_SCHEDULE,
+)
+from .schedule_sync import DAYS
+
+_LOGGER = logging.getLogger(__name__)
+
+ATTR_INTERFACE_ID = "interface_id"
+ATTR_DURATION = "duration"
+ATTR_COMMAND = "command"
+ATTR_TTL = "ttl"
+ATTR_NAME = "name"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_PERIODS = "periods"
+
+# Only show commands are accepted, as words or as a path with an optional query
+RCI_COMMAND = re.compile(r"^show(/[\w-][\w.-]*)*(\?[\w.=&/-]*)?$")
+
+BURST_SAMPLE_SCHEMA = vol.Schema({
+    vol.Required(ATTR_INTERFACE_ID): cv.string,
+    vol.Optional(ATTR_DURATION, default=DEFAULT_BURST_DURATION): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=MAX_BURST_DURATION)
+    ),
+})
+
+WIFI_SCHEDULE_SCHEMA = vol.Schema({
+    vol.Required(ATTR_INTERFACE_ID): cv.string,
+    vol.Required(ATTR_PERIODS): vol.All(cv.ensure_list, [vol.Schema({
+        vol.Required("start"): cv.time,
+        vol.Required("end"): cv.time,
+        vol.Optional("days", default=[]): vol.All(
+            cv.ensure_list, [vol.All(vol.Lower, vol.In(DAYS))]
+        ),
+    })]),
+})
+
+RCI_SCHEMA = vol.Schema({
+    vol.Required(ATTR_COMMAND): cv.string,
+    vol.Optional(ATTR_TTL, default=DEFAULT_RCI_TTL): vol.All(
+        vol.Coerce(int), vol.Range(min=0)
+    ),
+    vol.Optional(ATTR_NAME): cv.slug,
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+})
+
+
+def _get_rci_path(command: str) -> str:
+    """Return the RCI path of a show command, reject anything else."""
+    path = "/".join(command.strip().strip("/").split())
+    if not RCI_COMMAND.match(path):
+        raise ServiceValidationError(f"Only RCI show commands are allowed: {command}")
+    return path
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services once for all routers."""
+    if hass.services.has_service(DOMAIN, SERVICE_BURST_SAMPLE):
+        return
+
+    async def async_burst_sample(call: ServiceCall) -> None:
+        """Start burst sampling of an interface."""
+        interface_id = call.data[ATTR_INTERFACE_ID]
+        for entry_data in hass.data.get(DOMAIN, {}).values():
+            interfaces = (entry_data["coordinator"].data or {}).get("interface", {})
+            if interface_id in interfaces:
+                stat_name = interfaces[interface_id].get("stat_name", interface_id)
+                entry_data["burst_sampler"].start(
+                    interface_id, stat_name, call.data[ATTR_DURATION]
+                )
+                return
+        raise ServiceValidationError(f"Unknown Keenetic interface: {interface_id}")
+
+    async def async_set_wifi_schedule(call: ServiceCall) -> ServiceResponse:
+        """Sync the router schedule of an access point."""
+        interface_id = call.data[ATTR_INTERFACE_ID]
+        periods = [
+            {
+                "start": period["start"].strftime("%H:%M"),
+                "end": period["end"].strftime("%H:%M"),
+                "days": period["days"],
+            }
+            for period in call.data[ATTR_PERIODS]
+        ]
+        for entry_data in hass.data.get(DOMAIN, {}).values():
+            interfaces = (entry_data["coordinator"].data or {}).get("interface", {})
+            if interfaces.get(interface_id, {}).get("type") == "AccessPoint":
+                try:
+                    writes = await entry_data["api"].async_sync_wifi_schedule(
+                        interface_id, periods
+                    )
+                except (KeeneticAuthError, KeeneticConnectionError) as ex:
+                    raise HomeAssistantError(
+                        f"Failed to sync the schedule of {interface_id}: {ex}"
+                    ) from ex
+                return {"writes": writes}
+        raise ServiceValidationError(f"Unknown Keenetic access point: {interface_id}")
+
+    async def async_rci(call: ServiceCall) -> ServiceResponse:
+        """Run a cached read-only RCI query."""
+        path = _get_rci_path(call.data[ATTR_COMMAND])
+        entries = hass.data.get(DOMAIN, {})
+        entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID) or next(iter(entries), None)
+        if entry_id not in entries:
+            raise ServiceValidationError(f"Unknown Keenetic config entry: {entry_id}")
+
+        name = call.data.get(ATTR_NAME)
+        try:
+            result = await entries[entry_id]["rci_cache"].async_query(
+                path, call.data[ATTR_TTL], name
+            )
+        except (KeeneticAuthError, KeeneticConnectionError) as ex:
+            raise HomeAssistantError(f"RCI query {path} failed: {ex}") from ex
+
+        if name:
+            async_dispatcher_send(hass, SIGNAL_RCI_RESULT.format(entry_id))
+        return {"result": result}
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_BURST_SAMPLE, async_burst_sample, schema=BURST_SAMPLE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_WIFI_SCHEDULE,
+        async_set_wifi_schedule,
+        schema=WIFI_SCHEDULE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RCI,
+        async_rci,
+        schema=RCI_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove the integration services when the last router is unloaded."""
+    if hass.data.get(DOMAIN):
+        return
+    for service in (SERVICE_BURST_SAMPLE, SERVICE_SET_WIFI_SCHEDULE, SERVICE_RCI):
+        hass.services.async_remove(DOMAIN, service)
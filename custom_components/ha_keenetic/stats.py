@@ -0,0 +1,149 @@
+"""Streaming statistics for Keenetic metrics."""
+from __future__ import annotations
+from collections import deque
+import math
+
+
+class WindowAggregator:
+    """Aggregate the samples of one publish window.
+
+    Mean, min and max are updated in constant time per sample. The p95 is
+    taken from a bounded buffer of the most recent samples, so memory stays
+    fixed even if a window collects more samples than expected.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize the aggregator."""
+        self._samples: deque[float] = deque(maxlen=capacity)
+        self._count = 0
+        self._total = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+
+    def add(self, value: float) -> None:
+        """Add a sample to the window."""
+        self._samples.append(value)
+        self._count += 1
+        self._total += value
+        self._min = min(self._min, value)
+        self._max = max(self._max, value)
+
+    def flush(self) -> dict | None:
+        """Return the window statistics and start a new window."""
+        if not self._count:
+            return None
+
+        ordered = sorted(self._samples)
+        result = {
+            "mean": round(self._total / self._count, 2),
+            "min": self._min,
+            "max": self._max,
+            "p95": ordered[max(math.ceil(0.95 * len(ordered)) - 1, 0)],
+            "samples": self._count,
+        }
+
+        self._samples.clear()
+        self._count = 0
+        self._total = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+        return result
+
+
+class RunningStats:
+    """Mean and variance of a stream, updated online with Welford's method."""
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, value: float) -> None:
+        """Add a sample."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        """Return the sample standard deviation."""
+        return math.sqrt(self.variance)
+
+
+class QuantileSketch:
+    """Estimate one quantile of a stream in constant memory.
+
+    Implements the P-square algorithm: five markers track the minimum, the
+    maximum, the quantile and two points around it, and are adjusted with a
+    piecewise-parabolic fit as samples arrive. No samples are kept.
+    """
+
+    def __init__(self, quantile: float) -> None:
+        """Initialize the sketch."""
+        self._quantile = quantile
+        self._heights: list[float] = []
+        self._positions = [0, 1, 2, 3, 4]
+        self._desired = [0, 2 * quantile, 4 * quantile, 2 + 2 * quantile, 4]
+        self._increments = [0, quantile / 2, quantile, (1 + quantile) / 2, 1]
+
+    def add(self, value: float) -> None:
+        """Add a sample."""
+        heights = self._heights
+        if len(heights) < 5:
+            heights.append(value)
+            heights.sort()
+            return
+
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = next(i for i in range(4) if heights[i] <= value < heights[i + 1])
+
+        positions = self._positions
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        for i in range(1, 4):
+            offset = self._desired[i] - positions[i]
+            if (offset >= 1 and positions[i + 1] - positions[i] > 1) or (
+                offset <= -1 and positions[i - 1] - positions[i] < -1
+            ):
+                step = 1 if offset > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = heights[i] + step * (heights[i + step] - heights[i]) / (
+                        positions[i + step] - positions[i]
+                    )
+                heights[i] = height
+                positions[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        """Return the piecewise-parabolic prediction of a marker height."""
+        q, n = self._heights, self._positions
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    @property
+    def value(self) -> float | None:
+        """Return the estimated quantile, None before the first sample."""
+        heights = self._heights
+        if not heights:
+            return None
+        if len(heights) < 5:
+            return heights[max(math.ceil(self._quantile * len(heights)) - 1, 0)]
+        return heights[2]
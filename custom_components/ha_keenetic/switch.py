@@ -19,6 +19,7 @@ from homeassistant.helpers.update_coordinator import (
 
 
 from .const import DOMAIN, MANUFACTURER
+from .consumers import DatasetConsumer
 from .icons import ICON_MOBILE, ICON_MOBILE_OFF, ICON_WIFI, ICON_WIFI_OFF
 
 _LOGGER = logging.getLogger(__name__)
@@ -64,8 +65,6 @@ async def async_setup_entry(
         _LOGGER.error("No data in coordinator")
         return
         
-    _LOGGER.debug("Coordinator data: %s", coordinator.data)
-    
     if "interface" not in coordinator.data:
         _LOGGER.error("No interface data in coordinator data")
         return
@@ -76,11 +75,9 @@ async def async_setup_entry(
         if k.startswith("WifiMaster") and "AccessPoint" in k
     }
     
-    _LOGGER.debug("Found WiFi interfaces: %s", wifi_interfaces)
+    _LOGGER.debug("Found WiFi interfaces: %s", list(wifi_interfaces))
     
     for interface_id, interface_data in wifi_interfaces.items():
-        _LOGGER.debug("Processing WiFi interface: %s = %s", interface_id, interface_data)
-        
         if interface_data.get("ssid") or interface_data.get("description"):
             _LOGGER.debug("Creating switch for interface: %s", interface_id)
             entities.append(
@@ -99,8 +96,8 @@ async def async_setup_entry(
 
     if not entities:
         _LOGGER.warning(
-            "No WiFi switches were created. Full interface data: %s",
-            coordinator.data.get("interface", {})
+            "No WiFi switches were created. Interfaces: %s",
+            list(coordinator.data.get("interface", {}))
         )
     
 
@@ -109,11 +106,9 @@ async def async_setup_entry(
         if k.startswith("UsbLte")
     }
 
-    _LOGGER.debug("Found Mobile interfaces: %s", mobile_interfaces)
+    _LOGGER.debug("Found Mobile interfaces: %s", list(mobile_interfaces))
 
     for interface_id, interface_data in mobile_interfaces.items():
-     _LOGGER.debug("Processing Mobile interface: %s = %s", interface_id, interface_data)
-        
      if interface_data.get("ssid") or interface_data.get("description"):
         _LOGGER.debug("Creating switch for interface: %s", interface_id)
         entities.append(
@@ -139,11 +134,9 @@ async def async_setup_entry(
         if k.startswith("UsbModem")
     }
 
-    _LOGGER.debug("Found Usb Modem interfaces: %s", usb_modem_interfaces)
+    _LOGGER.debug("Found Usb Modem interfaces: %s", list(usb_modem_interfaces))
 
     for interface_id, interface_data in usb_modem_interfaces.items():
-     _LOGGER.debug("Processing Usb Modem  interface: %s = %s", interface_id, interface_data)
-        
      if interface_data.get("ssid") or interface_data.get("description"):
         _LOGGER.debug("Creating switch for interface: %s", interface_id)
         entities.append(
@@ -162,9 +155,20 @@ async def async_setup_entry(
 
     async_add_entities(entities)
 
-class KeeneticWiFiSwitch(CoordinatorEntity, SwitchEntity):
+class KeeneticWiFiSwitch(DatasetConsumer, CoordinatorEntity, SwitchEntity):
     """Representation of a Keenetic WiFi switch."""
 
+    _datasets = ("wifi",)
+    _unrecorded_attributes = frozenset({
+        "mac",
+        "ssid",
+        "encryption",
+        "interface_name",
+        "description",
+        "type",
+        "password",
+    })
+
     def __init__(
             self,
             coordinator: DataUpdateCoordinator,
@@ -265,9 +269,19 @@ class KeeneticWiFiSwitch(CoordinatorEntity, SwitchEntity):
             _LOGGER.error("Failed to turn off WiFi network %s: %s", self._ap_id, str(ex))
 
 
-class KeeneticMobileSwitch(CoordinatorEntity, SwitchEntity):
+class KeeneticMobileSwitch(DatasetConsumer, CoordinatorEntity, SwitchEntity):
     """Representation of a Keenetic Mobile switch."""
 
+    _datasets = ("modems",)
+    _unrecorded_attributes = frozenset({
+        "interface_name",
+        "description",
+        "type",
+        "mac",
+        "sim",
+        "temperature",
+    })
+
     def __init__(
             self,
             coordinator: DataUpdateCoordinator,
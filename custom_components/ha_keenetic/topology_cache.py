@@ -0,0 +1,171 @@
+"""Startup topology cache for Keenetic integration."""
+import logging
+from typing import AbstractSet, Dict, Any, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, STORAGE_VERSION, STORAGE_KEY_TOPOLOGY, TOPOLOGY_SAVE_DELAY
+from .consumers import get_interface_dataset
+
+_LOGGER = logging.getLogger(__name__)
+
+# Device information needed to name entities before the first poll
+DEVICE_KEYS = (
+    "device",
+    "manufacturer",
+    "model",
+    "firmware_version",
+    "firmware_branch",
+    "hardware_version",
+    "hostname",
+    "domainname",
+)
+
+# Interface fields that describe the topology, states and counters are
+# left out so the snapshot never publishes outdated values
+INTERFACE_KEYS = (
+    "id",
+    "type",
+    "label",
+    "description",
+    "ssid",
+    "stat_name",
+    "uplink",
+    "tunnel_type",
+    "interface-name",
+)
+
+# Interface fields whose keys decide which entities exist, stored without values
+INTERFACE_KEYED_FIELDS = ("attributes", "signal", "peers")
+
+# Mesh node fields that describe the topology
+MESH_NODE_KEYS = ("id", "known_host", "hostname", "model", "status", "backhaul", "topology")
+MESH_ATTRIBUTE_KEYS = ("ip", "mode", "hw_id")
+
+
+class TopologyCache:
+    """Persist the last known router topology.
+
+    The snapshot lets entities be created right away on startup while the
+    first real poll runs in the background. It is only written when the set
+    of interfaces, mesh nodes or the device information changes, so it only
+    holds what defines the entities and none of their values. Interfaces and
+    mesh nodes of datasets that are not fetched keep their last known records,
+    so enabling one of their entities still finds it after the reload.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the topology cache."""
+        self._store = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.{STORAGE_KEY_TOPOLOGY}"
+        )
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._signature: Optional[tuple] = None
+
+    async def async_load(self) -> Optional[Dict[str, Any]]:
+        """Load the cached topology, None if there is none."""
+        data = await self._store.async_load()
+        if not data or "interface" not in data:
+            return None
+        # Snapshots of older versions also stored the values
+        self._snapshot = self._build_snapshot(data)
+        self._signature = self._get_signature(self._snapshot)
+        _LOGGER.debug(
+            "Loaded cached topology with %d interfaces and %d mesh nodes",
+            len(self._snapshot["interface"]),
+            len(self._snapshot["mesh"]),
+        )
+        return {
+            **self._snapshot,
+            "interface": {
+                interface_id: dict(interface_data)
+                for interface_id, interface_data in self._snapshot["interface"].items()
+            },
+            "mesh": {
+                node_id: dict(node_data)
+                for node_id, node_data in self._snapshot["mesh"].items()
+            },
+        }
+
+    @staticmethod
+    def _get_signature(data: Dict[str, Any]) -> tuple:
+        """Return the parts of the data that define the topology."""
+        return (
+            tuple(sorted(data.get("interface", {}))),
+            tuple(sorted(data.get("mesh", {}))),
+            tuple(data.get(key) for key in DEVICE_KEYS),
+        )
+
+    @staticmethod
+    def _get_interface_topology(interface_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the fields of an interface that define its entities."""
+        topology = {key: interface_data[key] for key in INTERFACE_KEYS if key in interface_data}
+        for field in INTERFACE_KEYED_FIELDS:
+            if isinstance(interface_data.get(field), dict):
+                topology[field] = dict.fromkeys(interface_data[field])
+        return topology
+
+    @staticmethod
+    def _get_node_topology(node_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the fields of a mesh node that define its place in the mesh."""
+        topology = {key: node_data[key] for key in MESH_NODE_KEYS if key in node_data}
+        attributes = node_data.get("attributes", {})
+        topology["attributes"] = {
+            key: attributes[key] for key in MESH_ATTRIBUTE_KEYS if key in attributes
+        }
+        return topology
+
+    def _get_skipped(
+        self, data: Dict[str, Any], skipped: AbstractSet[str]
+    ) -> Dict[str, Any]:
+        """Return the cached records of skipped datasets missing from the data."""
+        if not skipped or self._snapshot is None:
+            return {"interface": {}, "mesh": {}}
+        return {
+            "interface": {
+                interface_id: interface_data
+                for interface_id, interface_data in self._snapshot["interface"].items()
+                if interface_id not in data.get("interface", {})
+                and get_interface_dataset(interface_id, interface_data) in skipped
+            },
+            "mesh": (
+                self._snapshot["mesh"]
+                if "mesh" in skipped and not data.get("mesh")
+                else {}
+            ),
+        }
+
+    def update(self, data: Dict[str, Any], skipped: AbstractSet[str] = frozenset()) -> None:
+        """Schedule a save if the topology differs from the cached one."""
+        kept = self._get_skipped(data, skipped)
+        signature = self._get_signature({
+            **data,
+            "interface": {**data.get("interface", {}), **kept["interface"]},
+            "mesh": {**data.get("mesh", {}), **kept["mesh"]},
+        })
+        if signature == self._signature:
+            return
+
+        self._signature = signature
+        snapshot = self._build_snapshot(data)
+        snapshot["interface"].update(kept["interface"])
+        snapshot["mesh"].update(kept["mesh"])
+        self._snapshot = snapshot
+        _LOGGER.debug("Topology changed, scheduling save")
+        self._store.async_delay_save(lambda: self._snapshot, TOPOLOGY_SAVE_DELAY)
+
+    @classmethod
+    def _build_snapshot(cls, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the topology and device information of the data."""
+        return {
+            **{key: data.get(key) for key in DEVICE_KEYS if key in data},
+            "interface": {
+                interface_id: cls._get_interface_topology(interface_data)
+                for interface_id, interface_data in data.get("interface", {}).items()
+            },
+            "mesh": {
+                node_id: cls._get_node_topology(node_data)
+                for node_id, node_data in data.get("mesh", {}).items()
+            },
+        }
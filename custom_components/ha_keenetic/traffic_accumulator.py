@@ -0,0 +1,119 @@
+"""Persistent traffic accounting for Keenetic integration."""
+import logging
+from typing import Dict, Any, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, STORAGE_VERSION, STORAGE_KEY_TRAFFIC, TRAFFIC_SAVE_DELAY
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TrafficAccumulator:
+    """Accumulate interface byte counters into daily and monthly totals.
+
+    Router counters restart from zero after a reboot, so only the positive
+    difference between two samples is added. The last raw counter is stored
+    together with the totals, which lets traffic seen while Home Assistant
+    was down be accounted on the first poll after a restart.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the accumulator."""
+        self._store = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.{STORAGE_KEY_TRAFFIC}"
+        )
+        self._interfaces: Dict[str, Dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load accumulated totals from storage."""
+        data = await self._store.async_load()
+        if data:
+            self._interfaces = data.get("interfaces", {})
+        _LOGGER.debug("Loaded traffic totals for %d interfaces", len(self._interfaces))
+
+    async def async_save(self) -> None:
+        """Write accumulated totals to storage immediately."""
+        await self._store.async_save(self._data_to_save())
+
+    def _data_to_save(self) -> dict:
+        """Return data for storage."""
+        return {"interfaces": self._interfaces}
+
+    @staticmethod
+    def _delta(last: Optional[int], current: int) -> int:
+        """Return counter increase, treating a decrease as a counter reset."""
+        if last is None:
+            return 0
+        if current < last:
+            return current
+        return current - last
+
+    def update(self, interfaces: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the latest counters and return totals per interface."""
+        now = dt_util.now()
+        day = now.date().isoformat()
+        month = now.strftime("%Y-%m")
+
+        for interface_id, interface_data in interfaces.items():
+            attributes = interface_data.get("attributes") or {}
+            if "rx_bytes" not in attributes and "tx_bytes" not in attributes:
+                continue
+
+            try:
+                rx_bytes = int(attributes.get("rx_bytes") or 0)
+                tx_bytes = int(attributes.get("tx_bytes") or 0)
+            except (TypeError, ValueError):
+                continue
+
+            # Zero on both counters means the statistics request failed
+            if not rx_bytes and not tx_bytes:
+                continue
+
+            state = self._interfaces.setdefault(interface_id, {
+                "last_rx": None,
+                "last_tx": None,
+                "day": day,
+                "month": month,
+                "daily_rx": 0,
+                "daily_tx": 0,
+                "monthly_rx": 0,
+                "monthly_tx": 0,
+            })
+
+            if state["day"] != day:
+                state["day"] = day
+                state["daily_rx"] = 0
+                state["daily_tx"] = 0
+            if state["month"] != month:
+                state["month"] = month
+                state["monthly_rx"] = 0
+                state["monthly_tx"] = 0
+
+            delta_rx = self._delta(state["last_rx"], rx_bytes)
+            delta_tx = self._delta(state["last_tx"], tx_bytes)
+            state["daily_rx"] += delta_rx
+            state["daily_tx"] += delta_tx
+            state["monthly_rx"] += delta_rx
+            state["monthly_tx"] += delta_tx
+            state["last_rx"] = rx_bytes
+            state["last_tx"] = tx_bytes
+
+        self._store.async_delay_save(self._data_to_save, TRAFFIC_SAVE_DELAY)
+
+        return self.totals(interfaces)
+
+    def totals(self, interfaces: Dict[str, Any]) -> Dict[str, Any]:
+        """Return accumulated totals of the given interfaces."""
+        return {
+            interface_id: {
+                "daily_rx": state["daily_rx"],
+                "daily_tx": state["daily_tx"],
+                "monthly_rx": state["monthly_rx"],
+                "monthly_tx": state["monthly_tx"],
+            }
+            for interface_id, state in self._interfaces.items()
+            if interface_id in interfaces
+        }
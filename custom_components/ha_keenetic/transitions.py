@@ -0,0 +1,113 @@
+"""State transition detection for Keenetic integration."""
+import logging
+from typing import AbstractSet, Dict, Any, List, Optional, Tuple
+
+from .const import (
+    EVENT_LINK_CHANGED,
+    EVENT_SSID_CHANGED,
+    EVENT_MODEM_CHANGED,
+    EVENT_MESH_TOPOLOGY_CHANGED,
+)
+from .consumers import get_interface_dataset
+
+_LOGGER = logging.getLogger(__name__)
+
+Transition = Tuple[str, Dict[str, Any]]
+
+
+class TransitionDetector:
+    """Turn consecutive snapshots into compact transition events.
+
+    Only the state that matters for each kind of interface is remembered
+    between polls: the link of ports and WAN connections, whether an access
+    point is up and whether a modem is connected. Mesh changes come already
+    diffed from the mesh topology. Interfaces missing from a dataset that was
+    not refreshed by the poll keep their last known state.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the detector."""
+        self._states: Optional[Dict[str, Tuple[str, Any]]] = None
+        self._datasets: Dict[str, str] = {}
+
+    @staticmethod
+    def _get_state(interface_data: Dict[str, Any]) -> Tuple[str, Any]:
+        """Return the kind of an interface and the state watched for it."""
+        if interface_data.get("type") == "AccessPoint":
+            return EVENT_SSID_CHANGED, bool(interface_data.get("up"))
+        if interface_data.get("uplink") and interface_data.get("type") != "wan":
+            return EVENT_MODEM_CHANGED, bool(interface_data.get("up"))
+        return EVENT_LINK_CHANGED, interface_data.get("link", "down")
+
+    @staticmethod
+    def _get_event_data(
+        event_type: str, interface_id: str, interface_data: Dict[str, Any], state: Any
+    ) -> Dict[str, Any]:
+        """Return the payload of a transition event."""
+        if event_type == EVENT_SSID_CHANGED:
+            return {"interface_id": interface_id, "ssid": interface_data.get("ssid"), "up": state}
+        if event_type == EVENT_MODEM_CHANGED:
+            return {
+                "interface_id": interface_id,
+                "operator": interface_data.get("operator"),
+                "connected": state,
+            }
+        return {"interface_id": interface_id, "type": interface_data.get("type"), "link": state}
+
+    def seed(self, interfaces: Dict[str, Any]) -> None:
+        """Remember a snapshot without reporting transitions."""
+        self._states = {
+            interface_id: self._get_state(interface_data)
+            for interface_id, interface_data in interfaces.items()
+        }
+        self._datasets = {
+            interface_id: get_interface_dataset(interface_id, interface_data)
+            for interface_id, interface_data in interfaces.items()
+        }
+
+    def update(
+        self,
+        interfaces: Dict[str, Any],
+        mesh_changes: List[Dict[str, Any]],
+        fresh: AbstractSet[str],
+    ) -> List[Transition]:
+        """Return the transitions since the previous snapshot.
+
+        The first snapshot is the baseline and only reports mesh changes.
+        ``fresh`` holds the datasets refreshed by this poll.
+        """
+        transitions: List[Transition] = [
+            (EVENT_MESH_TOPOLOGY_CHANGED, change) for change in mesh_changes
+        ]
+        previous = self._states
+        previous_datasets = self._datasets
+        self.seed(interfaces)
+        if previous is None:
+            return transitions
+
+        for interface_id, (event_type, state) in self._states.items():
+            known = previous.get(interface_id)
+            if known is not None and known != (event_type, state):
+                transitions.append((
+                    event_type,
+                    self._get_event_data(event_type, interface_id, interfaces[interface_id], state),
+                ))
+
+        for interface_id, (event_type, state) in previous.items():
+            if interface_id in self._states:
+                continue
+            dataset = previous_datasets.get(interface_id)
+            if dataset not in fresh:
+                # Stale, skipped or expired datasets say nothing about departures
+                self._states[interface_id] = (event_type, state)
+                self._datasets[interface_id] = dataset
+                continue
+            # A modem that was unplugged disappears from the interface list
+            if event_type == EVENT_MODEM_CHANGED and state:
+                transitions.append((
+                    event_type, {"interface_id": interface_id, "operator": None, "connected": False}
+                ))
+
+        if transitions:
+            _LOGGER.debug("Detected transitions: %s", transitions)
+        return transitions
@@ -0,0 +1,97 @@
+"""VPN tunnel processor for Keenetic integration."""
+import logging
+from typing import Dict, Any, Callable, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+# Interface types of VPN tunnels in the interface list
+TUNNEL_TYPES = ("Wireguard", "OpenVPN", "IPsec", "L2TP", "PPTP", "SSTP")
+
+
+class TunnelProcessor:
+    """Process VPN tunnels from Keenetic router.
+
+    Tunnels are taken from the interface list, then the details and
+    statistics of all of them are fetched with one batched request. The
+    details of WireGuard tunnels include their peers and handshakes.
+    """
+
+    @staticmethod
+    def _process_peers(details: dict) -> Dict[str, Any]:
+        """Return the peer summary of a WireGuard tunnel."""
+        peers = (details.get("wireguard") or {}).get("peer", [])
+        handshakes = []
+        for peer in peers:
+            try:
+                handshake = int(peer.get("last-handshake"))
+            except (TypeError, ValueError):
+                continue
+            # Peers that never completed a handshake report a negative age
+            if handshake >= 0:
+                handshakes.append(handshake)
+        return {
+            "peers": len(peers),
+            "peers_online": sum(1 for peer in peers if peer.get("online")),
+            "handshake_age": min(handshakes) if handshakes else None,
+        }
+
+    @staticmethod
+    async def process_interfaces(interface_info: dict, request_fn: Callable) -> Dict[str, Any]:
+        """Process tunnel interfaces and return formatted data."""
+        tunnel_data = {}
+
+        try:
+            tunnels = {
+                interface_id: interface_data
+                for interface_id, interface_data in interface_info.items()
+                if interface_data.get("type") in TUNNEL_TYPES
+            }
+            if not tunnels:
+                return tunnel_data
+
+            commands = []
+            for tunnel_id in tunnels:
+                commands.append({"show": {"interface": {"name": tunnel_id}}})
+                commands.append({"show": {"interface": {"stat": {"name": tunnel_id}}}})
+            data = await request_fn("post", "/rci/", json_data=commands)
+            if not isinstance(data, list):
+                raise ValueError("No tunnel information received")
+
+            for index, (tunnel_id, interface_data) in enumerate(tunnels.items()):
+                details = (data[2 * index] or {}).get("show", {}).get("interface", {}) or {}
+                stats = (
+                    (data[2 * index + 1] or {}).get("show", {}).get("interface", {}).get("stat", {})
+                    or {}
+                )
+                tunnel_type = interface_data["type"]
+                description = interface_data.get("description", "")
+                peers: Optional[Dict[str, Any]] = None
+                if tunnel_type == "Wireguard":
+                    peers = TunnelProcessor._process_peers(details)
+
+                tunnel_data[tunnel_id] = {
+                    "id": tunnel_id,
+                    "stat_name": tunnel_id,
+                    "type": "tunnel",
+                    "tunnel_type": tunnel_type,
+                    "description": description,
+                    "label": f"VPN:{description or tunnel_id}",
+                    "link": interface_data.get("link", "down"),
+                    "peers": peers,
+                    "attributes": {
+                        "tunnel_type": tunnel_type,
+                        "interface_name": interface_data.get("interface-name", ""),
+                        "ip_address": interface_data.get("address", ""),
+                        "rx_speed": stats.get("rxspeed", 0),
+                        "tx_speed": stats.get("txspeed", 0),
+                        "rx_bytes": stats.get("rxbytes", 0),
+                        "tx_bytes": stats.get("txbytes", 0),
+                    },
+                }
+
+            _LOGGER.debug("Processed tunnels: %s", list(tunnel_data))
+            return tunnel_data
+
+        except Exception as ex:
+            _LOGGER.debug("Error processing tunnels: %s", str(ex))
+            raise
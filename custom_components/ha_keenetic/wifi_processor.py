@@ -1,6 +1,6 @@
 """WiFi data processor for Keenetic integration."""
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Callable
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -8,52 +8,87 @@ class WiFiProcessor:
     """Process WiFi data from Keenetic router."""
 
     @staticmethod
-    async def process_wifi_interfaces(session, base_url, auth_token) -> Dict[str, Any]:
+    async def process_wifi_interfaces(request_fn: Callable) -> Dict[str, Any]:
         """Process WiFi interfaces and return formatted data."""
         wifi_data = {}
         try:
             for band in ["WifiMaster0", "WifiMaster1"]:
-                async with session.get(
-                    f"{base_url}/rci/interface/{band}",
-                    headers={"Authorization": f"Basic {auth_token}"},
-                ) as response:
-                    if response.status == 200:
-                        master_data = await response.json()
-                        _LOGGER.debug("%s data: %s", band, master_data)
-                        
-                        for i in range(7):
-                            ap_id = f"{band}/AccessPoint{i}"
-                            async with session.get(
-                                f"{base_url}/rci/interface/{ap_id}",
-                                headers={"Authorization": f"Basic {auth_token}"},
-                            ) as ap_response:
-                                if ap_response.status == 200:
-                                    ap_data = await ap_response.json()
-                                    _LOGGER.debug("AP data for %s: %s", ap_id, ap_data)
-                                    if ap_data.get("ssid"):
-                                        wifi_password = (
-                                            ap_data.get("authentication", {})
-                                            .get("wpa-psk", {})
-                                            .get("psk", "")
-                                        )
-                                        wifi_data[ap_id] = {
-                                            "id": ap_id,
-                                            "type": "AccessPoint",
-                                            "description": ap_data.get("description", ""),
-                                            "ssid": ap_data.get("ssid"),
-                                            "up": ap_data.get("up", False),
-                                            "encryption": ap_data.get("encryption", {}),
-                                            "link": "up" if ap_data.get("up") else "down",
-                                            "mac": ap_data.get("mac", ""),
-                                            "interface-name": ap_data.get("interface-name", ""),
-                                            "connected": ap_data.get("connected", "no"),
-                                            "state": ap_data.get("state", "down"),
-                                            "password": wifi_password
-                                        }
+                master_data = await request_fn("get", f"/rci/interface/{band}")
+                if master_data is None:
+                    continue
+
+                for i in range(7):
+                    ap_id = f"{band}/AccessPoint{i}"
+                    ap_data = await request_fn("get", f"/rci/interface/{ap_id}")
+                    if ap_data is None:
+                        continue
+                    if ap_data.get("ssid"):
+                        wifi_password = (
+                            ap_data.get("authentication", {})
+                            .get("wpa-psk", {})
+                            .get("psk", "")
+                        )
+                        wifi_data[ap_id] = {
+                            "id": ap_id,
+                            "type": "AccessPoint",
+                            "description": ap_data.get("description", ""),
+                            "ssid": ap_data.get("ssid"),
+                            "up": ap_data.get("up", False),
+                            "encryption": ap_data.get("encryption", {}),
+                            "link": "up" if ap_data.get("up") else "down",
+                            "mac": ap_data.get("mac", ""),
+                            "interface-name": ap_data.get("interface-name", ""),
+                            "connected": ap_data.get("connected", "no"),
+                            "state": ap_data.get("state", "down"),
+                            "password": wifi_password
+                        }
                                         
-            _LOGGER.debug("Processed WiFi interfaces: %s", wifi_data)
+            _LOGGER.debug("Processed WiFi interfaces: %s", list(wifi_data))
             return wifi_data
             
         except Exception as ex:
-            _LOGGER.error("Error processing WiFi interfaces: %s", str(ex))
-            return {}
\ No newline at end of file
+            _LOGGER.debug("Error processing WiFi interfaces: %s", str(ex))
+            raise
+
+    @staticmethod
+    def process_associations(association_info: dict, weak_rssi: int) -> Dict[str, Any]:
+        """Index associated stations by MAC and compute per-AP signal statistics."""
+        stations = {}
+        access_points = {}
+
+        for station in association_info.get("station", []):
+            mac = station.get("mac")
+            ap_id = station.get("ap")
+            if not mac or not ap_id:
+                continue
+            stations[mac] = station
+
+            ap_stats = access_points.setdefault(ap_id, {
+                "clients": 0,
+                "weak_clients": 0,
+                "rssi_min": None,
+                "rssi_max": None,
+                "rssi_total": 0,
+                "rssi_count": 0,
+            })
+            ap_stats["clients"] += 1
+
+            rssi = station.get("rssi")
+            if rssi is None:
+                continue
+            ap_stats["rssi_count"] += 1
+            ap_stats["rssi_total"] += rssi
+            if ap_stats["rssi_min"] is None or rssi < ap_stats["rssi_min"]:
+                ap_stats["rssi_min"] = rssi
+            if ap_stats["rssi_max"] is None or rssi > ap_stats["rssi_max"]:
+                ap_stats["rssi_max"] = rssi
+            if rssi < weak_rssi:
+                ap_stats["weak_clients"] += 1
+
+        for ap_stats in access_points.values():
+            rssi_count = ap_stats.pop("rssi_count")
+            rssi_total = ap_stats.pop("rssi_total")
+            ap_stats["rssi_avg"] = round(rssi_total / rssi_count) if rssi_count else None
+
+        _LOGGER.debug("Processed %d associated stations", len(stations))
+        return {"stations": stations, "access_points": access_points}
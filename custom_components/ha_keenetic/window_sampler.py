@@ -0,0 +1,112 @@
+"""Windowed sampling of Keenetic load and traffic metrics."""
+from __future__ import annotations
+from datetime import timedelta
+import logging
+import math
+from typing import Dict, Any
+
+from homeassistant.core import HomeAssistant, CALLBACK_TYPE
+from homeassistant.helpers.event import async_track_time_interval
+
+from .stats import WindowAggregator
+
+_LOGGER = logging.getLogger(__name__)
+
+SYSTEM_METRICS = ("cpu_usage", "ram_usage")
+INTERFACE_METRICS = (("rx_speed", "rxspeed"), ("tx_speed", "txspeed"))
+
+
+class WindowSampler:
+    """Sample system load and interface rates between coordinator polls.
+
+    Samples are taken every ``sample_interval`` seconds and aggregated until
+    the coordinator publishes, which then carries mean/min/max/p95 of the
+    window instead of a single point.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api,
+        sample_interval: int,
+        publish_interval: int,
+    ) -> None:
+        """Initialize the sampler."""
+        self._hass = hass
+        self._api = api
+        self._sample_interval = sample_interval
+        # One spare slot absorbs timer jitter between the two schedules
+        self._capacity = math.ceil(publish_interval / sample_interval) + 1
+        self._system: Dict[str, WindowAggregator] = {
+            metric: WindowAggregator(self._capacity) for metric in SYSTEM_METRICS
+        }
+        self._interfaces: Dict[str, Dict[str, WindowAggregator]] = {}
+        self._stat_names: Dict[str, str] = {}
+        self._sampling = False
+
+    def start(self) -> CALLBACK_TYPE:
+        """Start sampling, return a callback that stops it."""
+        return async_track_time_interval(
+            self._hass,
+            self._async_sample,
+            timedelta(seconds=self._sample_interval),
+            name="Keenetic window sampler",
+        )
+
+    def track(self, interfaces: Dict[str, Any]) -> None:
+        """Set the interfaces to sample from the latest coordinator data."""
+        self._stat_names = {
+            interface_id: interface_data.get("stat_name", interface_id)
+            for interface_id, interface_data in interfaces.items()
+            if "rx_speed" in interface_data.get("attributes", {})
+        }
+        for interface_id in list(self._interfaces):
+            if interface_id not in self._stat_names:
+                del self._interfaces[interface_id]
+
+    async def _async_sample(self, now=None) -> None:
+        """Take one sample of every tracked metric."""
+        if self._sampling:
+            return
+        self._sampling = True
+        try:
+            system_info, statistics = await self._api.async_get_load_sample(
+                list(self._stat_names.values())
+            )
+        except Exception as ex:
+            _LOGGER.debug("Skipping sample: %s", ex)
+            return
+        finally:
+            self._sampling = False
+
+        for metric in SYSTEM_METRICS:
+            if metric in system_info:
+                self._system[metric].add(float(system_info[metric]))
+
+        for interface_id, stat_name in self._stat_names.items():
+            stats = statistics.get(stat_name)
+            if not stats:
+                continue
+            aggregators = self._interfaces.setdefault(interface_id, {
+                metric: WindowAggregator(self._capacity) for metric, _ in INTERFACE_METRICS
+            })
+            for metric, key in INTERFACE_METRICS:
+                if key in stats:
+                    aggregators[metric].add(float(stats[key]))
+
+    def flush(self) -> Dict[str, Any]:
+        """Return the statistics of the finished window per metric."""
+        result: Dict[str, Any] = {"interface": {}}
+        for metric, aggregator in self._system.items():
+            window = aggregator.flush()
+            if window is not None:
+                result[metric] = window
+        for interface_id, aggregators in self._interfaces.items():
+            windows = {
+                metric: window
+                for metric, aggregator in aggregators.items()
+                if (window := aggregator.flush()) is not None
+            }
+            if windows:
+                result["interface"][interface_id] = windows
+        return result
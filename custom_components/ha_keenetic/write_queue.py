@@ -0,0 +1,103 @@
+"""Coalescing write queue for Keenetic integration."""
+from __future__ import annotations
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+SAVE_CONFIGURATION = {"system": {"configuration": {"save": {}}}}
+
+
+def _get_errors(response: Any) -> List[str]:
+    """Return the error messages found anywhere in an RCI response."""
+    errors = []
+    if isinstance(response, dict):
+        for key, value in response.items():
+            if key == "status" and isinstance(value, list):
+                errors.extend(
+                    status.get("message", str(status))
+                    for status in value
+                    if isinstance(status, dict) and status.get("status") == "error"
+                )
+            else:
+                errors.extend(_get_errors(value))
+    elif isinstance(response, list):
+        for item in response:
+            errors.extend(_get_errors(item))
+    return errors
+
+
+class WriteQueue:
+    """Collect configuration writes and send them as one batch.
+
+    A write replaces any pending write with the same key, so rapid toggles of
+    one interface collapse into the last one. After ``delay`` seconds without
+    new writes the batch is sent as one RCI request, followed by a single save
+    of the running configuration. Batches are sent one at a time, in order.
+    """
+
+    def __init__(
+        self, request_fn: Callable[..., Awaitable[Any]], delay: float
+    ) -> None:
+        """Initialize the queue."""
+        self._request_fn = request_fn
+        self._delay = delay
+        self._pending: Dict[str, Tuple[dict, asyncio.Future]] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flushes: Set[asyncio.Task] = set()
+        self._lock = asyncio.Lock()
+
+    async def async_write(self, key: str, command: dict) -> bool:
+        """Queue a command and wait until its batch was sent."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        replaced = self._pending.pop(key, None)
+        if replaced is not None:
+            # The replaced write is superseded, it succeeds with this one
+            future.add_done_callback(
+                lambda done, waiting=replaced[1]: waiting.done()
+                or waiting.set_result(done.result())
+            )
+        self._pending[key] = (command, future)
+
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = loop.call_later(self._delay, self._start_flush)
+        return await future
+
+    def _start_flush(self) -> None:
+        """Flush from the timer, keeping the task referenced until it is done."""
+        self._timer = None
+        task = asyncio.get_running_loop().create_task(self.async_flush())
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def async_flush(self) -> None:
+        """Send the pending writes now."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        async with self._lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+            batch = [command for command, _ in pending.values()]
+            _LOGGER.debug("Sending %d configuration writes", len(batch))
+
+            try:
+                data = await self._request_fn(
+                    "post", "/rci/", json_data=[*batch, SAVE_CONFIGURATION]
+                )
+                errors = _get_errors(data)
+                if errors:
+                    _LOGGER.error("Configuration writes were rejected: %s", "; ".join(errors))
+                result = isinstance(data, list) and not errors
+            except Exception as ex:
+                _LOGGER.error("Error sending configuration writes: %s", str(ex))
+                result = False
+
+            for _, future in pending.values():
+                if not future.done():
+                    future.set_result(result)